@@ -0,0 +1,17 @@
+"""
+Entry point for the `rin` command and `python -m rin`.
+"""
+
+import sys
+
+def main():
+    """Run the Rin CLI, answering --version without importing click or the commands"""
+    if sys.argv[1:] in (["-V"], ["--version"]):
+        from rin import __version__
+        print(__version__)
+        return 0
+    from rin.cli import cli
+    return cli()
+
+if __name__ == '__main__':
+    sys.exit(main())
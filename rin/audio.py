@@ -1,33 +1,116 @@
-import logging
+import asyncio
+import shutil
+import subprocess
 import time
 from pathlib import Path
 import tempfile
 import os
+from typing import TYPE_CHECKING
 from rin.config import AUDIO_DIR
 from rin.logging_config import loggers
 
 logger = loggers['audio']
 
-# Try to import audio-related modules, but handle if they're missing
-AUDIO_RECORDING_AVAILABLE = False
-AUDIO_PLAYBACK_AVAILABLE = False
-
-try:
+if TYPE_CHECKING:
     import sounddevice as sd
-    import numpy as np
-    import wave
-    AUDIO_RECORDING_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Audio recording modules not available: {str(e)}")
-    logger.warning("Audio recording will be simulated")
 
-try:
-    from pydub import AudioSegment
-    from pydub.playback import play
-    AUDIO_PLAYBACK_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Audio playback modules not available: {str(e)}")
-    logger.warning("Audio playback will be simulated")
+# Prefer a native player binary: it plays the file directly instead of
+# decoding it into a pydub AudioSegment and re-encoding a temp WAV first
+_FFPLAY = shutil.which("ffplay")
+_AFPLAY = shutil.which("afplay")
+if _FFPLAY:
+    _PLAYER_CMD = [_FFPLAY, "-nodisp", "-autoexit", "-loglevel", "quiet"]
+elif _AFPLAY:
+    _PLAYER_CMD = [_AFPLAY]
+else:
+    _PLAYER_CMD = None
+
+# Minimal empty WAV file written when real recording isn't possible
+_DUMMY_WAV = b'RIFF$\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x00>\x00\x00\x00>\x00\x00\x01\x00\x08\x00data\x00\x00\x00\x00'
+_TMP = Path(tempfile.gettempdir())
+
+# Audio modules are imported on first use (sounddevice initializes PortAudio
+# and numpy is slow to import), so commands that never touch audio skip them
+_recording_probe_cache = None
+_playback_probe_cache = None
+_simpleaudio_cache = None
+
+def _probe_recording():
+    """Import the recording stack once; returns (sounddevice, numpy, wave) or False"""
+    global _recording_probe_cache
+    if _recording_probe_cache is None:
+        try:
+            import sounddevice
+            import numpy
+            import wave
+            _recording_probe_cache = (sounddevice, numpy, wave)
+        except ImportError as e:
+            logger.warning(f"Audio recording modules not available: {str(e)}")
+            logger.warning("Audio recording will be simulated")
+            _recording_probe_cache = False
+    return _recording_probe_cache
+
+def _probe_playback():
+    """Import pydub once; returns (AudioSegment, play) or False"""
+    global _playback_probe_cache
+    if _playback_probe_cache is None:
+        try:
+            from pydub import AudioSegment
+            from pydub.playback import play
+            _playback_probe_cache = (AudioSegment, play)
+        except ImportError as e:
+            logger.warning(f"Audio playback modules not available: {str(e)}")
+            logger.warning("Audio playback will be simulated")
+            _playback_probe_cache = False
+    return _playback_probe_cache
+
+def _probe_simpleaudio():
+    """Import simpleaudio once; returns the module or False"""
+    global _simpleaudio_cache
+    if _simpleaudio_cache is None:
+        try:
+            import simpleaudio
+            _simpleaudio_cache = simpleaudio
+        except ImportError:
+            _simpleaudio_cache = False
+    return _simpleaudio_cache
+
+def _play_wav(sa, path):
+    """Hand a PCM WAV straight to the OS mixer and block until it finishes"""
+    sa.WaveObject.from_wave_file(path).play().wait_done()
+
+def _prepare_playback():
+    """Run the playback probes play_audio would otherwise do on first use"""
+    _probe_simpleaudio()
+    if not _PLAYER_CMD:
+        _probe_playback()
+
+def _open_wav_writer(path, sample_rate, wave):
+    """Open a mono 16-bit WAV writer; returns (writer, write_block)"""
+    try:
+        # libsndfile writes the numpy buffer directly, no tobytes() copy
+        import soundfile as sf
+        writer = sf.SoundFile(str(path), 'w', sample_rate, 1, 'PCM_16')
+        return writer, writer.write
+    except ImportError:
+        writer = wave.open(str(path), 'wb')
+        writer.setnchannels(1)
+        writer.setsampwidth(2)  # 16-bit
+        writer.setframerate(sample_rate)
+        return writer, lambda block: writer.writeframes(block.tobytes())
+
+def _stop_stream(stream):
+    """Stop an input stream, letting pending buffers drain, then close it"""
+    stream.stop()
+    stream.close()
+
+def __getattr__(name):
+    # Keep AUDIO_*_AVAILABLE importable without probing at module load
+    if name == "AUDIO_RECORDING_AVAILABLE":
+        return bool(_probe_recording())
+    if name == "AUDIO_PLAYBACK_AVAILABLE":
+        return bool(_PLAYER_CMD) or bool(_probe_playback())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class AudioHandler:
     """Cross-platform audio recording and playback"""
@@ -36,54 +119,98 @@ class AudioHandler:
     async def record_audio(duration=5, sample_rate=16000):
         """Record audio from microphone for specified duration"""
         try:
-            if not AUDIO_RECORDING_AVAILABLE:
+            probe = _probe_recording()
+            if not probe:
                 logger.warning("Audio recording not available. Creating dummy audio file.")
                 # Create an empty temp file as a placeholder
-                temp_file = Path(tempfile.gettempdir()) / f"rin_dummy_recording_{int(time.time())}.wav"
-                with open(temp_file, 'wb') as f:
-                    # Write a minimal empty wav file
-                    f.write(b'RIFF$\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x00>\x00\x00\x00>\x00\x00\x01\x00\x08\x00data\x00\x00\x00\x00')
+                temp_file = _TMP / f"rin_dummy_recording_{int(time.time())}.wav"
+                temp_file.write_bytes(_DUMMY_WAV)
                 logger.info(f"Dummy recording created at {temp_file}")
                 return str(temp_file)
             
+            sd, _, wave = probe
             logger.info(f"Recording {duration}s of audio at {sample_rate}Hz")
-            recording = sd.rec(
-                int(duration * sample_rate),
-                samplerate=sample_rate,
-                channels=1,
-                dtype='int16'
-            )
-            sd.wait()  # Wait until recording is finished
+            temp_file = _TMP / f"rin_recording_{int(time.time())}.wav"
             
-            # Save to temp file
-            temp_file = Path(tempfile.gettempdir()) / f"rin_recording_{int(time.time())}.wav"
-            with wave.open(str(temp_file), 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(sample_rate)
-                wf.writeframes(recording.tobytes())
+            # Stream blocks straight to disk so memory stays bounded regardless
+            # of duration and a partial file survives if the process is killed.
+            # Opening the device and file can block, so do it in the executor.
+            loop = asyncio.get_running_loop()
+            writer, write_block = await loop.run_in_executor(
+                None, _open_wav_writer, temp_file, sample_rate, wave
+            )
+            try:
+                stream = await loop.run_in_executor(
+                    None,
+                    lambda: sd.InputStream(
+                        samplerate=sample_rate,
+                        channels=1,
+                        dtype='int16',
+                        blocksize=1024,
+                        callback=lambda indata, frames, t, status: write_block(indata)
+                    )
+                )
+                await loop.run_in_executor(None, stream.start)
+                try:
+                    # Yield to the event loop while the callback captures audio
+                    await asyncio.sleep(duration)
+                finally:
+                    await loop.run_in_executor(None, _stop_stream, stream)
+            finally:
+                await loop.run_in_executor(None, writer.close)
             
             logger.info(f"Recording saved to {temp_file}")
             return str(temp_file)
         except Exception as e:
             logger.error(f"Error recording audio: {str(e)}", exc_info=True)
             # Create a dummy file as fallback
-            temp_file = Path(tempfile.gettempdir()) / f"rin_error_recording_{int(time.time())}.wav"
-            with open(temp_file, 'wb') as f:
-                # Write a minimal empty wav file
-                f.write(b'RIFF$\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x00>\x00\x00\x00>\x00\x00\x01\x00\x08\x00data\x00\x00\x00\x00')
+            temp_file = _TMP / f"rin_error_recording_{int(time.time())}.wav"
+            temp_file.write_bytes(_DUMMY_WAV)
             logger.info(f"Fallback recording created at {temp_file}")
             return str(temp_file)
     
+    @staticmethod
+    async def prepare_playback():
+        """Import the playback backend ahead of time, e.g. while TTS is synthesizing"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _prepare_playback)
+    
     @staticmethod
     async def play_audio(file_path):
-        """Play audio file using pydub (cross-platform)"""
+        """Play audio file with ffplay/afplay, falling back to pydub (cross-platform)"""
         try:
-            if not AUDIO_PLAYBACK_AVAILABLE:
+            # PCM WAV (what record_audio produces) needs no decoding at all
+            if str(file_path).lower().endswith('.wav'):
+                sa = _probe_simpleaudio()
+                if sa:
+                    logger.info(f"Playing audio: {file_path}")
+                    loop = asyncio.get_running_loop()
+                    try:
+                        await loop.run_in_executor(None, _play_wav, sa, str(file_path))
+                        return True
+                    except Exception as e:
+                        # e.g. a compressed WAV simpleaudio can't read; use the player below
+                        logger.warning(f"simpleaudio playback failed, falling back: {str(e)}")
+            
+            player = _PLAYER_CMD
+            if player and player[0] == _AFPLAY and str(file_path).lower().endswith('.ogg'):
+                player = None  # afplay has no Ogg decoder; pydub/ffmpeg does
+            probe = None if player else _probe_playback()
+            if not player and not probe:
                 logger.warning(f"Audio playback not available. Would have played: {file_path}")
                 return True
                 
             logger.info(f"Playing audio: {file_path}")
+            if player:
+                proc = await asyncio.create_subprocess_exec(
+                    *player, str(file_path),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                await proc.wait()
+                return proc.returncode == 0
+            
+            AudioSegment, play = probe
             sound = AudioSegment.from_file(file_path)
             play(sound)
             return True
@@ -0,0 +1,151 @@
+"""
+Shared runtime for the Rin CLI commands.
+
+Each command lives in its own module in this package and is only imported
+when rin.cli's LazyGroup dispatches to it. Helpers here are kept light so
+importing a command module doesn't pull in the assistant stack.
+"""
+
+import asyncio
+import atexit
+import functools
+import sys
+from rin.logging_config import loggers
+
+logger = loggers['core']
+
+@functools.lru_cache(maxsize=1)
+def get_assistant():
+    """Create the Assistant on first use so light commands skip LLM/TTS/STT setup"""
+    from rin.core import Assistant
+    return Assistant()
+
+@functools.lru_cache(maxsize=1)
+def get_list_manager():
+    """Create the ListManager once per process"""
+    from rin.lists import ListManager
+    return ListManager()
+
+@functools.lru_cache(maxsize=1)
+def get_reminder_manager():
+    """Create the ReminderManager once per process"""
+    from rin.reminders import ReminderManager
+    return ReminderManager()
+
+@functools.lru_cache(maxsize=1)
+def get_draft_creator():
+    """Create the EmailDraftCreator once per process"""
+    from rin.email_drafts import EmailDraftCreator
+    return EmailDraftCreator()
+
+@functools.lru_cache(maxsize=1)
+def get_search_manager():
+    """Create the WebSearchManager once per process"""
+    from rin.search import WebSearchManager
+    return WebSearchManager()
+
+# Assistant first, so its background saves flush before the managers close
+_ACCESSORS = (get_assistant, get_list_manager, get_reminder_manager, get_draft_creator, get_search_manager)
+
+_LOOP = None
+
+def get_loop():
+    """Return the process-wide event loop, creating it on first use"""
+    global _LOOP
+    # A closed loop (after close_loop) is replaced, e.g. when a command runs another
+    if _LOOP is None or _LOOP.is_closed():
+        if _LOOP is None:
+            atexit.register(close_loop)
+        try:
+            import uvloop  # optional (speedups extra); wakes faster on thread-pool results
+            _LOOP = uvloop.new_event_loop()
+        except ImportError:
+            _LOOP = asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP
+
+def run(coro):
+    """Run a coroutine on the shared loop instead of paying asyncio.run's setup/teardown"""
+    return get_loop().run_until_complete(coro)
+
+def close_loop():
+    """Flush and close everything on the shared loop, then the loop itself"""
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    try:
+        # Let the assistant flush its background saves before tasks are cancelled,
+        # and close the managers' long-lived DB connections
+        for accessor in _ACCESSORS:
+            if accessor.cache_info().currsize:
+                _LOOP.run_until_complete(accessor().aclose())
+        # Cancel leftovers (e.g. scheduled reminder tasks) as asyncio.run would
+        pending = asyncio.all_tasks(_LOOP)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _LOOP.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+        _LOOP.run_until_complete(_LOOP.shutdown_default_executor())
+    finally:
+        _LOOP.close()
+        # The cached objects hold events/locks bound to the closed loop, so the
+        # next command on a new loop builds fresh ones
+        for accessor in _ACCESSORS:
+            accessor.cache_clear()
+
+async def prepare_play():
+    """Load the audio playback backend so a following play() starts right away"""
+    from rin.audio import AudioHandler
+    await AudioHandler.prepare_playback()
+
+async def play(audio_path):
+    """Play audio with the built-in player, falling back to system commands"""
+    from rin.audio import AudioHandler
+    playback_success = await AudioHandler.play_audio(audio_path)
+    
+    # If built-in playback fails, try using system commands
+    if not playback_success:
+        _play_with_system_command(audio_path)
+
+@functools.lru_cache(maxsize=1)
+def _system_player():
+    """Resolve the platform's playback command once; None means use os.startfile"""
+    import shutil
+    if sys.platform == "win32":  # Windows
+        return None
+    if sys.platform == "darwin":  # macOS
+        candidates = ("afplay", "open")
+    else:
+        # Linux: paplay plays the file itself, xdg-open hands it to a desktop app
+        candidates = ("paplay", "xdg-open")
+    for name in candidates:
+        path = shutil.which(name)
+        if path:
+            return [path]
+    return []
+
+def _play_with_system_command(audio_path):
+    """Play audio using system commands if PyAudio fails"""
+    import subprocess
+    try:
+        player = _system_player()
+        if player is None:
+            # Opens with the default app directly, no cmd.exe for 'start'
+            import os
+            os.startfile(audio_path)
+        elif not player:
+            logger.warning(f"No system audio player found to play: {audio_path}")
+            return
+        else:
+            # Launch without waiting so playback doesn't hold up the CLI; no shell
+            # and no preexec_fn, so subprocess can use posix_spawn
+            subprocess.Popen(
+                player + [audio_path],
+                close_fds=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        logger.info(f"Played audio using system command: {audio_path}")
+    except Exception as e:
+        logger.error(f"Error playing audio with system command: {str(e)}")
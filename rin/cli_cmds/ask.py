@@ -0,0 +1,14 @@
+import click
+from rin.cli_cmds import get_assistant, run
+
+@click.command()
+@click.argument('query')
+def ask(query):
+    """Ask Rin a question"""
+    try:
+        response = run(get_assistant().process_query(query))
+        click.echo(f"Rin: {response['text']}")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+cmd = ask
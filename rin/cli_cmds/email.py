@@ -0,0 +1,111 @@
+import click
+from rin.cli_cmds import get_draft_creator, run
+
+# Display format for draft creation times
+_DRAFT_FMT = "%Y-%m-%d %H:%M"
+
+@click.group()
+def email():
+    """Create and manage email drafts"""
+    pass
+
+@email.command()
+@click.option('--to', prompt='Recipient', help='Email recipient')
+@click.option('--subject', prompt='Subject', help='Email subject')
+@click.option('--tone', default='professional', help='Email tone (professional, friendly, formal, etc.)')
+@click.argument('content_prompt', required=True)
+def draft(to, subject, tone, content_prompt):
+    """Create an email draft from a prompt"""
+    try:
+        draft_creator = get_draft_creator()
+        draft = run(draft_creator.create_draft(to, subject, content_prompt, tone))
+        
+        if "error" in draft or not draft:
+            click.echo(f"Error creating draft: {draft.get('error', 'Unknown error')}")
+            return
+        
+        click.echo(f"Created email draft (ID: {draft['id']}) stored in database.")
+        click.echo(f"To: {draft['recipient']}")
+        click.echo(f"Subject: {draft['subject']}")
+        click.echo(f"\n{draft['content']}")
+        click.echo(f"\nUse 'rin email show {draft['id']}' to view later.")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@email.command(name="list")
+def list_drafts():
+    """List all email drafts from the database"""
+    import datetime
+    try:
+        draft_creator = get_draft_creator()
+        drafts = run(draft_creator.get_drafts())
+        
+        if not drafts:
+            click.echo("No email drafts found in the database.")
+            return
+        
+        lines = ["Email drafts (from database):"]
+        for draft in drafts:
+            created_at_str = draft.get("created_at", "Unknown time")
+            try: # Format timestamp nicely
+                 created_dt = datetime.datetime.fromisoformat(created_at_str)
+                 created_at_display = created_dt.strftime(_DRAFT_FMT)
+            except:
+                 created_at_display = created_at_str
+                 
+            lines.append(f"ID: {draft['id']}")
+            lines.append(f"Created: {created_at_display}")
+            lines.append(f"To: {draft['recipient']}")
+            lines.append(f"Subject: {draft['subject']}")
+            lines.append(f"Tone: {draft.get('tone', 'professional')}")
+            lines.append("-" * 40)
+        click.echo("\n".join(lines))
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@email.command()
+@click.argument('draft_id')
+def show(draft_id):
+    """Show an email draft by ID from the database"""
+    import datetime
+    try:
+        draft_creator = get_draft_creator()
+        draft = run(draft_creator.get_draft(draft_id))
+        
+        if not draft:
+            click.echo(f"Draft {draft_id} not found in database.")
+            return
+        
+        created_at_str = draft.get("created_at", "Unknown time")
+        try: # Format timestamp nicely
+             created_dt = datetime.datetime.fromisoformat(created_at_str)
+             created_at_display = created_dt.strftime(_DRAFT_FMT)
+        except:
+             created_at_display = created_at_str
+             
+        click.echo(f"Email Draft (ID: {draft['id']}) - From Database")
+        click.echo(f"Created: {created_at_display}")
+        click.echo(f"To: {draft['recipient']}")
+        click.echo(f"Subject: {draft['subject']}")
+        click.echo(f"Tone: {draft.get('tone', 'professional')}")
+        click.echo("\nContent:")
+        click.echo(draft['content'])
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@email.command()
+@click.argument('draft_id')
+def delete(draft_id):
+    """Delete an email draft by ID from the database"""
+    try:
+        draft_creator = get_draft_creator()
+        success = run(draft_creator.delete_draft(draft_id))
+        
+        if success:
+            click.echo(f"Deleted draft {draft_id} from database.")
+        else:
+            click.echo(f"Failed to delete draft {draft_id}. Draft might not exist.")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+cmd = email
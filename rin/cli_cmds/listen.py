@@ -0,0 +1,53 @@
+import asyncio
+import click
+from rin.cli_cmds import get_assistant, play, prepare_play, run
+
+@click.command()
+@click.option('--voice/--no-voice', default=True, help="Enable/disable voice response")
+def listen(voice):
+    """Listen for voice command and respond"""
+    try:
+        run(_do_listen(voice))
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+async def _do_listen(voice):
+    """Listen, respond and play the reply within one event loop run"""
+    assistant = get_assistant()
+    result = await _listen_with_prewarm(assistant, voice)
+    click.echo(f"You said: {result.get('query', '')}")
+    
+    if 'parts' in result:
+        # Speak sentence by sentence as the reply streams in: playback starts
+        # after the first sentence is synthesized, while the rest is still
+        # being written and synthesized
+        click.echo("Rin: ", nl=False)
+        error = None
+        try:
+            async for part in result['parts']:
+                click.echo(part['text_partial'] + " ", nl=False)
+                # A failed reply ends with an apology part that has no audio
+                error = part.get('error')
+                if part['audio_chunk']:
+                    await play(part['audio_chunk'])
+        finally:
+            # e.g. playback failed: stop synthesizing the rest of the reply
+            await result['parts'].aclose()
+            click.echo()
+        if error:
+            click.echo(f"Error: {error}")
+    else:
+        click.echo(f"Rin: {result.get('text', '')}")
+
+async def _listen_with_prewarm(assistant, voice=True):
+    """Warm up the engines (and playback, if replying by voice) while the microphone is recording"""
+    warmups = [assistant.warm()]
+    if voice:
+        warmups.append(prepare_play())
+    warmup = asyncio.gather(*warmups, return_exceptions=True)
+    try:
+        return await assistant.listen_and_respond(respond_with_voice=voice, stream=True)
+    finally:
+        await warmup
+
+cmd = listen
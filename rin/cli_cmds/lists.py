@@ -0,0 +1,117 @@
+import click
+from rin.cli_cmds import get_list_manager, run
+
+@click.group(name="list")
+def list_cmd():
+    """Manage lists (shopping, todos, etc.)"""
+    pass
+
+@list_cmd.command()
+@click.option('--items', '-i', is_flag=True, help="Also show the items in each list")
+def show_all(items):
+    """Show all available lists"""
+    try:
+        list_manager = get_list_manager()
+        if items:
+            # One query for every list and its items, rather than get_list() per name
+            lists = run(list_manager.get_all_lists_with_items())
+        else:
+            lists = run(list_manager.get_lists())
+        if not lists:
+            click.echo("No lists found.")
+            return
+        
+        click.echo("Available lists:")
+        for name in lists:
+            click.echo(f"- {name}")
+            if items:
+                for i, item in enumerate(lists[name]):
+                    click.echo(f"    {i+1}. {item}")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@list_cmd.command()
+@click.argument('name')
+def show(name):
+    """Show items in a specific list"""
+    try:
+        list_manager = get_list_manager()
+        items = run(list_manager.get_list(name))
+        if items is None:
+            click.echo(f"List '{name}' not found.")
+            return
+        
+        if not items:
+            click.echo(f"List '{name}' is empty.")
+            return
+            
+        click.echo(f"Items in {name}:")
+        for i, item in enumerate(items):
+            click.echo(f"{i+1}. {item}")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@list_cmd.command()
+@click.argument('name')
+@click.argument('items', nargs=-1)
+def create(name, items):
+    """Create a new list with optional initial items"""
+    try:
+        list_manager = get_list_manager()
+        success = run(list_manager.create_list(name, list(items)))
+        if success:
+            click.echo(f"Created list '{name}'.")
+        else:
+            click.echo(f"Failed to create list '{name}' (it may already exist).")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@list_cmd.command()
+@click.argument('name')
+@click.argument('items', nargs=-1, required=True)
+def add(name, items):
+    """Add one or more items to a list"""
+    try:
+        list_manager = get_list_manager()
+        if len(items) == 1:
+            success = run(list_manager.add_item(name, items[0]))
+        else:
+            success = run(list_manager.add_items(name, list(items)))
+        if success:
+            click.echo(f"Added {', '.join(repr(item) for item in items)} to list '{name}'.")
+        else:
+            click.echo(f"Failed to add item to list '{name}'. List might not exist.")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@list_cmd.command()
+@click.argument('name')
+@click.argument('item_num', type=int)
+def remove(name, item_num):
+    """Remove an item from a list by its number"""
+    try:
+        list_manager = get_list_manager()
+        # Adjust for 0-based indexing
+        success = run(list_manager.remove_item(name, item_num - 1))
+        if success:
+            click.echo(f"Removed item #{item_num} from list '{name}'.")
+        else:
+            click.echo(f"Failed to remove item from list '{name}'. Check list name and item number.")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@list_cmd.command()
+@click.argument('name')
+def delete(name):
+    """Delete a list entirely"""
+    try:
+        list_manager = get_list_manager()
+        success = run(list_manager.delete_list(name))
+        if success:
+            click.echo(f"Deleted list '{name}'.")
+        else:
+            click.echo(f"Failed to delete list '{name}'. List might not exist.")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+cmd = list_cmd
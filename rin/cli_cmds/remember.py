@@ -0,0 +1,24 @@
+import click
+from rin.cli_cmds import run
+
+@click.command()
+def remember():
+    """Show saved interactions"""
+    try:
+        # History lives in Storage alone; no need to bring up the LLM/TTS/STT engines
+        from rin.storage import Storage
+        storage = Storage()
+        try:
+            interactions = run(storage.get_interactions())
+        finally:
+            run(storage.aclose())
+        if interactions:
+            # One write for the whole history instead of one per interaction
+            click.echo("\n".join(
+                f"[{i+1}] You: {item['query']}\nRin: {item['response']}\n"
+                for i, item in enumerate(interactions)
+            ))
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+cmd = remember
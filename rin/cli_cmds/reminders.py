@@ -0,0 +1,123 @@
+import re
+import click
+from rin.cli_cmds import get_reminder_manager, run
+from rin.reminders import REMINDER_LIST_FMT, parse_reminder_time
+
+# Shared display formats
+_TIMER_FMT = "%H:%M:%S"
+_REMINDER_FMT = "%I:%M %p"
+
+@click.group()
+def reminder():
+    """Manage timers and reminders"""
+    pass
+
+@reminder.command()
+@click.argument('minutes', type=int)
+@click.argument('description', required=False, default="Timer")
+def timer(minutes, description):
+    """Set a timer for X minutes"""
+    try:
+        reminder_manager = get_reminder_manager()
+        seconds = minutes * 60
+        reminder = run(reminder_manager.set_timer(seconds, description))
+        
+        if reminder:
+            formatted_time = reminder["_due_dt"].strftime(_TIMER_FMT)
+            click.echo(f"Timer set: {description} (ID: {reminder['id']})")
+            click.echo(f"Will notify at {formatted_time}")
+        else:
+            click.echo("Failed to set timer.")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+# Formats 'reminder set --time' reads directly; anything else goes to parse_reminder_time
+_TIME_RE = re.compile(r'^(?:(?P<h>\d{1,2}):(?P<m>\d{2})|in\s+(?P<n>\d+)\s+(?P<unit>minute|hour)s?)$', re.IGNORECASE)
+
+@reminder.command("set")
+@click.option('--time', '-t', required=True, help="Time (e.g., '15:30', 'in 20 minutes', '9am')")
+@click.argument('description')
+def set_reminder_cmd(time, description):
+    """Set a reminder for a specific time"""
+    import datetime
+    try:
+        now = datetime.datetime.now()
+        
+        # Match the common formats ("HH:MM", "in N minutes/hours") in one pass
+        match = _TIME_RE.match(time.strip())
+        try:
+            if match and match.group('h'):
+                due_time = now.replace(
+                    hour=int(match.group('h')), minute=int(match.group('m')), second=0, microsecond=0
+                )
+                # If the time is in the past, assume next day
+                if due_time <= now:
+                    due_time += datetime.timedelta(days=1)
+            elif match:
+                amount = int(match.group('n'))
+                if match.group('unit').lower() == "minute":
+                    due_time = now + datetime.timedelta(minutes=amount)
+                else:
+                    due_time = now + datetime.timedelta(hours=amount)
+            else:
+                # The assistant's parser: '9am', 'friday', 'january 3', 'tomorrow at 2pm' ...
+                # with missing fields zeroed and past times rolled forward
+                due_time = parse_reminder_time(time.strip().lower(), now)
+                if due_time is None:
+                    raise ValueError(time)
+        except (ValueError, OverflowError):
+            click.echo("Invalid time format. Please use 'HH:MM' format, e.g., --time '14:30'")
+            return
+            
+        # Set the reminder
+        reminder_manager = get_reminder_manager()
+        reminder = run(reminder_manager.set_reminder(due_time.isoformat(), description))
+        
+        if reminder:
+            formatted_time = due_time.strftime(_REMINDER_FMT)
+            click.echo(f"Reminder set: {description} (ID: {reminder['id']})")
+            click.echo(f"Will notify at {formatted_time}")
+        else:
+            click.echo("Failed to set reminder.")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@reminder.command("list")
+def list_reminders():
+    """List all active reminders and timers"""
+    try:
+        reminder_manager = get_reminder_manager()
+        reminders = run(reminder_manager.get_reminders())
+        
+        if not reminders:
+            click.echo("No active reminders or timers.")
+            return
+        
+        lines = ["Active reminders and timers:"]
+        for r in reminders:
+            formatted_time = r["_due_dt"].strftime(REMINDER_LIST_FMT)
+            
+            r_type = r["type"].capitalize()
+            lines.append(f"{r_type} (ID: {r['id']}): {r['description']}")
+            lines.append(f"  Due at: {formatted_time}")
+            lines.append("")
+        click.echo("\n".join(lines))
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+@reminder.command()
+@click.argument('reminder_id')
+def cancel(reminder_id):
+    """Cancel a reminder by ID"""
+    try:
+        reminder_manager = get_reminder_manager()
+        success = run(reminder_manager.cancel_reminder(reminder_id))
+        
+        if success:
+            click.echo(f"Cancelled reminder with ID: {reminder_id}")
+        else:
+            click.echo(f"No active reminder found with ID: {reminder_id}")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+cmd = reminder
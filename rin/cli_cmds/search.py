@@ -0,0 +1,51 @@
+import click
+from rin.cli_cmds import get_search_manager, run
+
+@click.command()
+@click.argument('query')
+@click.option('--summary/--no-summary', default=True, help="Summarize results with LLM")
+@click.option('--num-results', type=int, default=3, help="Number of results to fetch/summarize")
+def search(query, summary, num_results):
+    """Search the web for information using the configured provider"""
+    try:
+        search_manager = get_search_manager()
+        
+        if summary:
+            result = run(search_manager.search_and_summarize(query, num_results=num_results))
+            
+            if "error" in result:
+                click.echo(f"Error: {result['error']}")
+                return
+            
+            click.echo(f"Search results for: {query}\n")
+            click.echo("Summary:")
+            click.echo(result.get("summary", "No summary generated."))
+            
+            if result.get("results"):
+                click.echo("\nSources:")
+                for i, res in enumerate(result["results"]):
+                    click.echo(f"{i+1}. {res['title']}")
+                    click.echo(f"   {res['link']}")
+        else:
+            # Raw results without summary
+            result = run(search_manager.raw_search(query, num_results=num_results))
+            
+            if "error" in result:
+                click.echo(f"Error: {result['error']}")
+                return
+                
+            results_list = result.get("results", [])
+            if results_list:
+                click.echo(f"Search results for: {query}\n")
+                for i, res in enumerate(results_list):
+                    click.echo(f"{i+1}. {res.get('title', 'No title')}")
+                    click.echo(f"   {res.get('link', '#')}")
+                    click.echo(f"   {res.get('snippet', 'No description.')}")
+                    click.echo("")
+            else:
+                click.echo("No results found.")
+                
+    except Exception as e:
+        click.echo(f"CLI Error: {str(e)}")
+
+cmd = search
@@ -0,0 +1,24 @@
+import asyncio
+import click
+from rin.cli_cmds import get_assistant, play, prepare_play, run
+
+@click.command()
+@click.argument('text')
+def speak(text):
+    """Convert text to speech"""
+    try:
+        run(_do_speak(text))
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+async def _do_speak(text):
+    """Synthesize and play text within one event loop run"""
+    # Load the playback backend while the TTS request is in flight
+    path, _ = await asyncio.gather(
+        get_assistant().tts.synthesize(text),
+        prepare_play()
+    )
+    click.echo(f"Audio saved to {path}")
+    await play(path)
+
+cmd = speak
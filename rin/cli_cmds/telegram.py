@@ -0,0 +1,22 @@
+import click
+from rin.cli_cmds import run
+
+@click.command()
+def telegram():
+    """Start the Telegram bot"""
+    try:
+        from rin.telegram_bot import RinTelegramBot
+        
+        click.echo("Starting Telegram bot...")
+        click.echo("Press Ctrl+C to stop")
+        bot = RinTelegramBot()
+        
+        # Run the bot until stopped; start() handles SIGINT/SIGTERM itself
+        run(bot.start())
+            
+    except KeyboardInterrupt:
+        click.echo("\nStopping Telegram bot...")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}")
+
+cmd = telegram
@@ -24,6 +24,7 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 
 # Engine options
 TTS_ENGINE = os.getenv("TTS_ENGINE", "google")
+TTS_AUDIO_ENCODING = os.getenv("TTS_AUDIO_ENCODING", "OGG_OPUS")  # or MP3
 STT_ENGINE = os.getenv("STT_ENGINE", "whisper")
 SEARCH_PROVIDER = os.getenv("SEARCH_PROVIDER", "serpapi")
 
@@ -31,6 +32,13 @@ SEARCH_PROVIDER = os.getenv("SEARCH_PROVIDER", "serpapi")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4")
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "int8")  # faster-whisper only
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", "64"))  # Telegram bot's default executor
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "512"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "300"))  # seconds
+TTS_CACHE_SIZE = int(os.getenv("TTS_CACHE_SIZE", "256"))  # audio files kept in AUDIO_DIR
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "512"))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "600"))  # seconds
 
 # Default system prompt
 SYSTEM_PROMPT = "You are Rin, a helpful personal assistant. Be concise but thorough."
@@ -1,18 +1,345 @@
 import asyncio
 import logging
 import datetime
+import functools
+import hashlib
 import re
+import time
+from collections import OrderedDict
 from rin.llm import LLMInterface
 from rin.tts import TTSInterface
 from rin.stt import STTInterface, WHISPER_AVAILABLE
 from rin.storage import Storage
-from rin.config import TTS_ENGINE, STT_ENGINE
+from rin.config import TTS_ENGINE, STT_ENGINE, LLM_CACHE_SIZE, LLM_CACHE_TTL
 from rin.logging_config import loggers
 from rin.lists import ListManager
-from rin.reminders import ReminderManager
+from rin.reminders import ReminderManager, REMINDER_LIST_FMT, parse_reminder_time
 
 logger = loggers['core']
 
+# google-re2 is optional (speedups extra): linear-time matching, no backtracking
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Every local date/time pattern contains one of these; anything else skips the main regex.
+# ("day" also covers "today" and "yesterday"; "month", "year" and "tomorrow" are
+# needed for "what month is it", "what year is it" and "what is tomorrow")
+_LOCAL_KEYWORDS = ("time", "date", "day", "month", "year", "tomorrow")
+
+_TIME_PATTERNS = (
+    r"what time is it",
+    r"current time",
+    r"tell me the time",
+    r"what's the time",
+    r"what is the time",
+)
+
+_DATE_PATTERNS = (
+    r"what day is it",
+    r"what is the date",
+    r"what's the date",
+    r"current date",
+    r"today's date",
+    r"what day of the week is it",
+    r"what month is it",
+    r"what year is it",
+    r"tell me the date",
+    r"can you tell me what day it is",
+    r"what is it today",
+    r"what's today",
+    r"what day is today",
+    r"today is what day",
+    r"what is today's date",
+)
+
+_TOMORROW_PATTERNS = (
+    r"what day is (?:it )?tomorrow",
+    r"what is tomorrow",
+    r"what's tomorrow",
+    r"what date is tomorrow",
+    r"what day will it be tomorrow",
+    r"tomorrow's date",
+)
+
+_YESTERDAY_PATTERNS = (
+    r"what day was (?:it )?yesterday",
+    r"what is yesterday",
+    r"what's yesterday",
+    r"what date was yesterday",
+    r"what day was it yesterday",
+    r"yesterday's date",
+)
+
+_DAY_OF_WEEK_PATTERN = r"what day (?:is|will) (?P<which_week>this|next) (?P<day_name>monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
+
+_FUTURE_DATE_PATTERN = r"what day (?:is|will be) (?:in) (?P<amount>\d+) (?P<unit>day|days|week|weeks|month|months)"
+
+_DATETIME_PATTERNS = (
+    r"what (?:is|are) the (?:date|day) and time",
+    r"what time and (?:date|day) is it",
+    r"current date and time",
+)
+
+# Reply formats for local queries
+_TIME_FMT = "%I:%M %p"
+_DATE_FMT = "%A, %B %d, %Y"
+_MONTH_DAY_FMT = "%B %d, %Y"
+_ONE_DAY = datetime.timedelta(days=1)
+
+# Fixed replies are whole strftime templates, so each is built by one C call
+_TIME_REPLY_FMT = "The current time is " + _TIME_FMT + "."
+_DATE_REPLY_FMT = "Today is " + _DATE_FMT + "."
+_TOMORROW_REPLY_FMT = "Tomorrow will be " + _DATE_FMT + "."
+_YESTERDAY_REPLY_FMT = "Yesterday was " + _DATE_FMT + "."
+_DATETIME_REPLY_FMT = "It's " + _DATE_FMT + ", and the current time is " + _TIME_FMT + "."
+
+# Local intents in priority order: (name, alternatives). New local intents
+# (weather, math, ...) are added here and still cost a single regex scan.
+_LOCAL_INTENTS = (
+    ("time", _TIME_PATTERNS),
+    ("date", _DATE_PATTERNS),
+    ("tomorrow", _TOMORROW_PATTERNS),
+    ("yesterday", _YESTERDAY_PATTERNS),
+    ("day_of_week", (_DAY_OF_WEEK_PATTERN,)),
+    ("future_date", (_FUTURE_DATE_PATTERN,)),
+    ("datetime", _DATETIME_PATTERNS),
+)
+
+# All local intents in one case-insensitive scan; the named group that matched
+# (match.lastgroup) says which intent it was. Ties at the same position go to
+# the earlier intent, as the old per-category checks did.
+_LOCAL_RE = re.compile(
+    "|".join(f"(?P<{name}>{'|'.join(patterns)})" for name, patterns in _LOCAL_INTENTS),
+    re.IGNORECASE
+)
+
+# With RE2 installed, a capture-free copy of _LOCAL_RE rejects queries that match
+# no local intent: its DFA fails in a couple of microseconds, where re retries
+# every alternative at every position. Hits still use _LOCAL_RE for the groups.
+_LOCAL_GATE = re2.compile("(?i)" + re.sub(r"\(\?P<\w+>", "(?:", _LOCAL_RE.pattern)) if re2 else None
+
+# Day name -> weekday number (0 = Monday, 6 = Sunday)
+_DAY_TO_NUM = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6
+}
+
+def _reply_time(now, match):
+    return now.strftime(_TIME_REPLY_FMT)
+
+def _reply_date(now, match):
+    return now.strftime(_DATE_REPLY_FMT)
+
+def _reply_tomorrow(now, match):
+    return (now + _ONE_DAY).strftime(_TOMORROW_REPLY_FMT)
+
+def _reply_yesterday(now, match):
+    return (now - _ONE_DAY).strftime(_YESTERDAY_REPLY_FMT)
+
+def _reply_day_of_week(now, match):
+    which_week = match.group("which_week").lower()  # "this" or "next"
+    day_name = match.group("day_name").lower()
+    target_day = _DAY_TO_NUM[day_name]
+    current_day = now.weekday()
+    
+    # Calculate days until target day
+    days_until = target_day - current_day
+    if days_until <= 0 and which_week == "next":
+        days_until += 7
+    elif days_until < 0 and which_week == "this":
+        days_until += 7
+    
+    target_date = now + datetime.timedelta(days=days_until)
+    return f"{which_week.capitalize()} {day_name.capitalize()} is {target_date.strftime(_MONTH_DAY_FMT)}."
+
+def _reply_future_date(now, match):
+    amount = int(match.group("amount"))
+    unit = match.group("unit").lower()
+    
+    future_date = now
+    if unit in ["day", "days"]:
+        future_date = now + datetime.timedelta(days=amount)
+    elif unit in ["week", "weeks"]:
+        future_date = now + datetime.timedelta(days=amount * 7)
+    elif unit in ["month", "months"]:
+        # Approximate - months have different lengths
+        future_date = now + datetime.timedelta(days=amount * 30)
+    
+    return f"In {amount} {unit}, it will be {future_date.strftime(_DATE_FMT)}."
+
+def _reply_datetime(now, match):
+    return now.strftime(_DATETIME_REPLY_FMT)
+
+# Local intent name (a _LOCAL_RE group) -> reply builder taking (now, match)
+_LOCAL_REPLIES = {
+    "time": _reply_time,
+    "date": _reply_date,
+    "tomorrow": _reply_tomorrow,
+    "yesterday": _reply_yesterday,
+    "day_of_week": _reply_day_of_week,
+    "future_date": _reply_future_date,
+    "datetime": _reply_datetime,
+}
+
+# Intents whose reply depends only on the current minute, and their replies for
+# the minute they were built in, so repeat queries within a minute skip strftime
+_MINUTE_INTENTS = frozenset(("time", "date", "tomorrow", "yesterday", "datetime"))
+_MINUTE_CACHE = {"minute": None, "replies": {}}
+
+def _minute_reply(intent):
+    """Reply for a _MINUTE_INTENTS intent, built at most once per wall-clock minute"""
+    ts = time.time()
+    minute = int(ts) // 60
+    if _MINUTE_CACHE["minute"] != minute:
+        _MINUTE_CACHE["minute"] = minute
+        _MINUTE_CACHE["replies"] = {}
+    replies = _MINUTE_CACHE["replies"]
+    reply = replies.get(intent)
+    if reply is None:
+        # Formatted from the same timestamp the minute key came from
+        reply = replies[intent] = _LOCAL_REPLIES[intent](datetime.datetime.fromtimestamp(ts), None)
+    return reply
+
+# Whole-query literal triggers -> intent, for the common exact phrasings. Each
+# literal's intent is whatever _LOCAL_RE picks for it, so priority is unchanged.
+_LITERAL_INTENTS = {
+    pattern: _LOCAL_RE.search(pattern).lastgroup
+    for _, patterns in _LOCAL_INTENTS
+    for pattern in patterns
+    if not any(ch in pattern for ch in "\\.^$*+?{}[]()|")
+}
+
+# List and reminder parsing runs captures like ([\w\s]+) and (.+?) over the
+# whole query; RE2 matches those in linear time, so use it when installed.
+# RE2 takes no flag arguments, hence inline (?i) where case is ignored.
+_linear_re = re2.compile if re2 else re.compile
+
+# List command patterns (matched against the lowercased query)
+# (keyword, pattern): the pattern only runs when its keyword is in the query
+_LIST_NAME_RES = (
+    ("list", _linear_re(r"list ([a-zA-Z0-9_\- ]+)(?: list)?")),
+    ("called", _linear_re(r"called ([a-zA-Z0-9_\- ]+)")),
+    ("named", _linear_re(r"named ([a-zA-Z0-9_\- ]+)")),
+)
+_LIST_ITEM_RES = (
+    ("add", _linear_re(r"add ([a-zA-Z0-9_\- ]+) to")),
+    ("put", _linear_re(r"put ([a-zA-Z0-9_\- ]+) to")),
+)
+_CREATE_LIST_RE = _linear_re(r"create (?:a|an|the) ([a-zA-Z0-9_\- ]+) list")
+_SHOW_LIST_RE = _linear_re(r"(?:show|what's on|what is in) (?:my|the) ([a-zA-Z0-9_\- ]+) list")
+_REMOVE_ITEM_RE = _linear_re(r"remove (?:item )?([\w\s]+) from (?:my|the)? ([\w\s]+) list")
+_DELETE_LIST_RE = _linear_re(r"delete (?:my|the) ([\w\s]+) list")
+
+# Reminder command patterns (case-insensitive, matched against the raw query)
+# The unit group that matched ("h", "m" or "s") picks its multiplier in _TIMER_UNIT_SECONDS
+_TIMER_RE = _linear_re(r'(?i)(set|create|start) (?:a|the)? timer (?:for|of) (\d+) (?:(?P<h>hours?|hrs?)|(?P<m>minutes?|mins?)|(?P<s>seconds?|secs?))')
+_TIMER_UNIT_SECONDS = (("h", 3600), ("m", 60), ("s", 1))
+_TIMER_DESC_RE = _linear_re(r'(?i)(?:called|named|for) ([a-zA-Z0-9_\- ]+)')
+# "remind me to X at Y" and "set a reminder for X at Y" share one pattern: group 1 is X, group 2 is Y
+_REMINDER_RE = _linear_re(r'(?i)(?:(?:remind|reminder|remember) me (?:to|about)|set a reminder (?:for|to|about)) (.+?) (?:at|on) (.+)')
+_LIST_REMINDERS_RE = _linear_re(r'(?i)(show|list|what|tell me about|any) (?:my|are my|do i have)? ?(?:active )?(reminders|timers)')
+_CANCEL_REMINDER_RE = _linear_re(r'(?i)(?:cancel|delete|remove) (?:the|my)? (?:reminder|timer) (?:for|called|named|with id) ([a-zA-Z0-9_\- ]+)')
+
+# Search and email command patterns (case-insensitive, matched against the raw query)
+_SEARCH_RES = (
+    re.compile(r"search (?:for|about) (.+)", re.IGNORECASE),
+    re.compile(r"look up (.+)", re.IGNORECASE),
+    re.compile(r"find (?:information|info) (?:about|on) (.+)", re.IGNORECASE),
+    re.compile(r"what is (.+)", re.IGNORECASE),
+    re.compile(r"who is (.+)", re.IGNORECASE),
+    re.compile(r"tell me about (.+)", re.IGNORECASE),
+)
+_EMAIL_RES = (
+    re.compile(r"(?:write|draft|compose) (?:an |a )?email (?:to|for) (.+?) (?:about|regarding|re:|on) (.+)", re.IGNORECASE),
+    re.compile(r"help me (?:write|draft|compose) (?:an |a )?email (?:to|for) (.+?) (?:about|regarding|re:|on) (.+)", re.IGNORECASE),
+    re.compile(r"create (?:an |a )?email (?:to|for) (.+?) (?:about|regarding|re:|on) (.+)", re.IGNORECASE),
+)
+_TONE_RE = re.compile(r"in a (professional|formal|casual|friendly|informal) tone", re.IGNORECASE)
+_LIST_DRAFTS_RE = re.compile(r"(show|list|what) (?:are |my )?email drafts", re.IGNORECASE)
+
+def _extract_list_name(q):
+    """Pull a list name out of a lowercased list command"""
+    # Basic extraction, needs improvement for robustness
+    for keyword, pattern in _LIST_NAME_RES:
+        match = keyword in q and pattern.search(q)
+        if match:
+            return match.group(1).strip()
+    return None
+
+def _extract_list_item(q):
+    """Pull the item out of an 'add/put X to ...' list command"""
+    for keyword, pattern in _LIST_ITEM_RES:
+        match = keyword in q and pattern.search(q)
+        if match:
+            return match.group(1).strip()
+    return None
+
+# A keyword every pattern of a command handler needs, grouped by handler, plus
+# the local date/time keywords, so one scan decides which handlers can possibly
+# match the query. "local" goes last so "timer" is not cut short at "time".
+_ROUTER_RE = re.compile(
+    r"(?P<list>list)"
+    r"|(?P<reminder>timer|remind|remember)"
+    r"|(?P<search>search|look up|find|what is|who is|tell me about)"
+    r"|(?P<email>email)"
+    r"|(?P<local>" + "|".join(_LOCAL_KEYWORDS) + ")",
+    re.IGNORECASE
+)
+
+# Replies are spoken sentence by sentence when streamed
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Timer durations, reminder due times and draft timestamps repeat across replies and listings
+@functools.lru_cache(maxsize=256)
+def _format_duration(seconds):
+    """Format a duration in seconds to a human-readable string"""
+    if seconds < 60:
+        return f"{seconds} second{'s' if seconds != 1 else ''}"
+    hours, minutes = divmod(seconds // 60, 60)
+    if hours == 0:
+        return f"{minutes} minute{'s' if minutes != 1 else ''}"
+    if minutes == 0:
+        return f"{hours} hour{'s' if hours != 1 else ''}"
+    return f"{hours} hour{'s' if hours != 1 else ''} and {minutes} minute{'s' if minutes != 1 else ''}"
+
+@functools.lru_cache(maxsize=256)
+def _format_due_time(due_dt):
+    """Format a reminder's due datetime for the reminder listing"""
+    return due_dt.strftime(REMINDER_LIST_FMT)
+
+@functools.lru_cache(maxsize=256)
+def _format_draft_time(created_at):
+    """Format a draft's stored created_at string for the drafts listing"""
+    try:
+        return datetime.datetime.fromisoformat(created_at).strftime("%b %d %H:%M")
+    except (TypeError, ValueError):
+        return "??"
+
+def _llm_key(llm, query):
+    """Key LLM answers on (model, normalized query)"""
+    # Collapse whitespace so e.g. a transcription's leading space still
+    # coalesces with the same typed query; closing .!? don't change the question
+    text = " ".join(query.split())
+    return (getattr(llm, "model", None), text.rstrip(".!?").rstrip() or text)
+
+def _llm_disk_key(model, query):
+    """Key for an answer in the persistent response cache"""
+    return hashlib.blake2b(f"{model}\x00{query}".encode(), digest_size=16).hexdigest()
+
+async def _stream_sentences(deltas):
+    """Regroup streamed text deltas into sentences, yielding each once it is complete"""
+    buffer = ""
+    async for delta in deltas:
+        buffer += delta
+        *sentences, buffer = _SENTENCE_END_RE.split(buffer)
+        for sentence in sentences:
+            if sentence.strip():
+                yield sentence.strip()
+    if buffer.strip():
+        yield buffer.strip()
+
 class Assistant:
     """Core assistant logic, separate from UI/CLI concerns"""
     
@@ -26,52 +353,64 @@ class Assistant:
         try:
             self.stt = STTInterface.create(stt_engine)
         except (ImportError, NotImplementedError) as e:
-            logger.warning(f"Failed to initialize {stt_engine} STT engine: {str(e)}")
+            logger.warning("Failed to initialize %s STT engine: %s", stt_engine, str(e))
             logger.warning("Falling back to dummy STT engine (no actual speech recognition)")
             self.stt = STTInterface.create("dummy")
             stt_engine = "dummy"
             
+        # LLM answers keyed on (model, query): LRU of (response, expiry) plus
+        # the in-flight calls so concurrent duplicates share one request
+        self._resp_cache = OrderedDict()
+        self._inflight = {}
+        self._warmup = None
+        
+        # Command managers are shared across queries; search and email pull in
+        # aiohttp/LLM clients, so those two are built on their first command
+        self.list_manager = ListManager()
+        self.reminder_manager = ReminderManager()
+        self._search_manager = None
+        self._draft_creator = None
+        
         logger.info("Assistant initialized with TTS: %s, STT: %s", TTS_ENGINE, stt_engine)
     
+    async def aclose(self):
+        """Flush queued interaction saves and close the managers' connections"""
+        await self.storage.aclose()
+        await self.list_manager.aclose()
+        await self.reminder_manager.aclose()
+        if self._draft_creator is not None:
+            await self._draft_creator.aclose()
+        if self._search_manager is not None:
+            await self._search_manager.aclose()
+        await self.tts.aclose()
+    
+    async def warm(self):
+        """Warm the engines and open the database connections concurrently; runs once per Assistant"""
+        if self._warmup is None:
+            self._warmup = asyncio.ensure_future(asyncio.gather(
+                self.llm.prewarm(),
+                self.tts.prewarm(),
+                self.stt.prewarm(),
+                self.storage.prewarm(),
+                self.list_manager.prewarm(),
+                self.reminder_manager.prewarm(),
+                return_exceptions=True
+            ))
+        await asyncio.shield(self._warmup)
+    
     async def process_query(self, query, respond_with_voice=False):
         """Process a text query and return response"""
         try:
             logger.info("Processing query: %s", query)
             
-            # Check if this is a time-related query we can handle locally
-            local_response = self._handle_local_queries(query)
-            if local_response:
-                logger.info(f"Handled query locally: {local_response}")
-                response = local_response
-            else:
-                # Check if this is a list-related query
-                list_response = await self.handle_list_command(query)
-                if list_response:
-                    logger.info(f"Handled list query: {list_response}")
-                    response = list_response
-                else:
-                    # Check if this is a reminder-related query
-                    reminder_response = await self.handle_reminder_command(query)
-                    if reminder_response:
-                        logger.info(f"Handled reminder query: {reminder_response}")
-                        response = reminder_response
-                    else:
-                        # Check if this is a search-related query
-                        search_response = await self.handle_search_command(query)
-                        if search_response:
-                            logger.info(f"Handled search query: {search_response}")
-                            response = search_response
-                        else:
-                            # Check if this is an email-related query
-                            email_response = await self.handle_email_command(query)
-                            if email_response:
-                                logger.info(f"Handled email query: {email_response}")
-                                response = email_response
-                            else:
-                                # If not handled locally, use the LLM
-                                response = await self.llm.generate_response(query)
+            response = await self._route_query(query)
+            if not response:
+                # If not handled locally, use the LLM
+                response = await self._generate_llm_response(query)
                 
-            await self.storage.save_interaction(query, response)
+            # Persist off the critical path; the storage writer batches rows
+            # and aclose() flushes whatever is still queued
+            await self.storage.enqueue_interaction(query, response)
             
             audio_path = None
             if respond_with_voice:
@@ -88,193 +427,179 @@ class Assistant:
                 "text": "I encountered an error while processing your request."
             }
     
-    def _handle_local_queries(self, query):
-        """Handle common queries locally without using the LLM"""
-        # Convert query to lowercase for easier matching
-        query_lower = query.lower()
-        
-        # Time-related queries
-        time_patterns = [
-            r"what time is it",
-            r"current time",
-            r"tell me the time",
-            r"what's the time",
-            r"what is the time",
-        ]
-        
-        # Date-related queries
-        date_patterns = [
-            r"what day is it",
-            r"what is the date",
-            r"what's the date",
-            r"current date",
-            r"today's date",
-            r"what day of the week is it",
-            r"what month is it",
-            r"what year is it",
-            r"tell me the date",
-            r"can you tell me what day it is",
-            r"what is it today",
-            r"what's today",
-            r"what day is today",
-            r"today is what day",
-            r"what is today's date",
-        ]
-        
-        # Tomorrow-related queries
-        tomorrow_patterns = [
-            r"what day is (?:it )?tomorrow",
-            r"what is tomorrow",
-            r"what's tomorrow",
-            r"what date is tomorrow",
-            r"what day will it be tomorrow",
-            r"tomorrow's date",
-        ]
-        
-        # Yesterday-related queries
-        yesterday_patterns = [
-            r"what day was (?:it )?yesterday",
-            r"what is yesterday",
-            r"what's yesterday",
-            r"what date was yesterday",
-            r"what day was it yesterday",
-            r"yesterday's date",
-        ]
+    async def respond_stream(self, query):
+        """Answer a query by voice, yielding {"text_partial", "audio_chunk"} per sentence as its audio is ready
         
-        # Day of week queries
-        day_of_week_pattern = r"what day (?:is|will) (this|next) (monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
-        
-        # Future date queries
-        future_date_pattern = r"what day (?:is|will be) (?:in) (\d+) (day|days|week|weeks|month|months)"
-        
-        # Combined date and time queries
-        combined_patterns = [
-            r"what (?:is|are) the (?:date|day) and time",
-            r"what time and (?:date|day) is it",
-            r"current date and time",
-        ]
-        
-        # Check for time queries
-        for pattern in time_patterns:
-            if re.search(pattern, query_lower):
-                now = datetime.datetime.now()
-                return f"The current time is {now.strftime('%I:%M %p')}."
+        LLM answers are streamed, so the first sentence is being synthesized
+        while the model is still writing the rest.
+        A failure part-way through ends the stream with an apology part that
+        carries "error" and no audio.
+        """
+        logger.info("Processing query (streamed): %s", query)
+        try:
+            response = await self._route_query(query)
+            parts = None
+            if response:
+                sentences = [s for s in _SENTENCE_END_RE.split(response.strip()) if s]
+            else:
+                parts = []
+                sentences = _stream_sentences(self._stream_llm_response(query, parts))
+            stream = self.tts.synthesize_stream(sentences)
+            try:
+                async for sentence, audio_path in stream:
+                    yield {"text_partial": sentence, "audio_chunk": audio_path}
+            finally:
+                # Cancels pending syntheses and the LLM stream, also when the caller stops early
+                await stream.aclose()
+            if parts is not None:
+                response = "".join(parts)
+        except Exception as e:
+            logger.error("Error processing streamed query: %s", str(e), exc_info=True)
+            yield {
+                "error": str(e),
+                "text_partial": "I encountered an error while processing your request.",
+                "audio_chunk": None
+            }
+            return
+        await self.storage.enqueue_interaction(query, response)
+    
+    async def _route_query(self, query):
+        """Answer locally or with a command handler; None means the LLM should answer"""
+        # One keyword scan picks the local and command handlers worth trying
+        families = {m.lastgroup for m in _ROUTER_RE.finditer(query)}
+        # Lowercased once, and only if a handler that compares lowercase will run
+        query_lower = query.lower() if "local" in families or "list" in families else None
         
-        # Check for date queries
-        for pattern in date_patterns:
-            if re.search(pattern, query_lower):
-                now = datetime.datetime.now()
-                return f"Today is {now.strftime('%A, %B %d, %Y')}."
+        # Check if this is a time-related query we can handle locally
+        response = self._handle_local_queries(query, query_lower) if "local" in families else None
+        if response:
+            logger.info("Handled query locally: %s", response)
+            return response
         
-        # Check for tomorrow queries
-        for pattern in tomorrow_patterns:
-            if re.search(pattern, query_lower):
-                tomorrow = datetime.datetime.now() + datetime.timedelta(days=1)
-                return f"Tomorrow will be {tomorrow.strftime('%A, %B %d, %Y')}."
+        for family, handler, args in (
+            ("list", self.handle_list_command, (query, query_lower)),
+            ("reminder", self.handle_reminder_command, (query,)),
+            ("search", self.handle_search_command, (query,)),
+            ("email", self.handle_email_command, (query,)),
+        ):
+            if family in families:
+                response = await handler(*args)
+                if response:
+                    logger.info("Handled %s query: %s", family, response)
+                    return response
+        return None
+    
+    async def _generate_llm_response(self, query):
+        """Answer via the LLM, reusing recent answers and sharing in-flight calls"""
+        key = _llm_key(self.llm, query)
+        cached = self._cached_llm_response(key)
+        if cached is not None:
+            return cached
         
-        # Check for yesterday queries
-        for pattern in yesterday_patterns:
-            if re.search(pattern, query_lower):
-                yesterday = datetime.datetime.now() - datetime.timedelta(days=1)
-                return f"Yesterday was {yesterday.strftime('%A, %B %d, %Y')}."
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_llm_response(key, query))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._store_llm_response(key, t))
+        # Shield so one cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _stream_llm_response(self, query, parts):
+        """Yield the LLM answer as text deltas, appending each to parts; a cached answer is one delta"""
+        key = _llm_key(self.llm, query)
+        response = self._cached_llm_response(key)
+        if response is None and key in self._inflight:
+            response = await asyncio.shield(self._inflight[key])
+        disk_key = _llm_disk_key(*key)
+        if response is None:
+            response = await self.storage.get_cached_response(disk_key, LLM_CACHE_TTL)
+        if response is not None:
+            parts.append(response)
+            yield response
+            return
         
-        # Check for day of week queries
-        day_match = re.search(day_of_week_pattern, query_lower)
-        if day_match:
-            which_week = day_match.group(1).lower()  # "this" or "next"
-            day_name = day_match.group(2).lower()
-            
-            # Map day name to day number (0 = Monday, 6 = Sunday)
-            day_to_num = {
-                "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-                "friday": 4, "saturday": 5, "sunday": 6
-            }
-            target_day = day_to_num[day_name]
-            
-            # Get current date and day of week
-            now = datetime.datetime.now()
-            current_day = now.weekday()  # 0 = Monday, 6 = Sunday
-            
-            # Calculate days until target day
-            days_until = target_day - current_day
-            if days_until <= 0 and which_week == "next":
-                days_until += 7
-            elif days_until < 0 and which_week == "this":
-                days_until += 7
-            
-            target_date = now + datetime.timedelta(days=days_until)
-            return f"{which_week.capitalize()} {day_name.capitalize()} is {target_date.strftime('%B %d, %Y')}."
+        async for delta in self.llm.generate_response_stream(query):
+            parts.append(delta)
+            yield delta
+        response = "".join(parts)
+        self._remember_llm_response(key, response)
+        await self.storage.set_cached_response(disk_key, response, LLM_CACHE_TTL)
+    
+    async def _fetch_llm_response(self, key, query):
+        """Answer from the persistent response cache, else ask the LLM and persist it"""
+        disk_key = _llm_disk_key(*key)
+        cached = await self.storage.get_cached_response(disk_key, LLM_CACHE_TTL)
+        if cached is not None:
+            logger.info("Using persisted LLM response")
+            return cached
         
-        # Check for future date queries
-        future_match = re.search(future_date_pattern, query_lower)
-        if future_match:
-            amount = int(future_match.group(1))
-            unit = future_match.group(2).lower()
-            
-            now = datetime.datetime.now()
-            future_date = now
-            
-            if unit in ["day", "days"]:
-                future_date = now + datetime.timedelta(days=amount)
-            elif unit in ["week", "weeks"]:
-                future_date = now + datetime.timedelta(days=amount * 7)
-            elif unit in ["month", "months"]:
-                # Approximate - months have different lengths
-                future_date = now + datetime.timedelta(days=amount * 30)
-            
-            return f"In {amount} {unit}, it will be {future_date.strftime('%A, %B %d, %Y')}."
+        response = await self.llm.generate_response(query)
+        await self.storage.set_cached_response(disk_key, response, LLM_CACHE_TTL)
+        return response
+    
+    def _cached_llm_response(self, key):
+        """Return a fresh in-memory answer for key, or None"""
+        cached = self._resp_cache.get(key)
+        if cached is not None:
+            response, expires = cached
+            if expires > time.monotonic():
+                self._resp_cache.move_to_end(key)
+                logger.info("Using cached LLM response")
+                return response
+            del self._resp_cache[key]
+        return None
+    
+    def _store_llm_response(self, key, task):
+        """Cache a finished LLM call; failures are not cached"""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._remember_llm_response(key, task.result())
+    
+    def _remember_llm_response(self, key, response):
+        """Add an answer to the in-memory LRU"""
+        self._resp_cache[key] = (response, time.monotonic() + LLM_CACHE_TTL)
+        self._resp_cache.move_to_end(key)
+        while len(self._resp_cache) > LLM_CACHE_SIZE:
+            self._resp_cache.popitem(last=False)
+    
+    def _handle_local_queries(self, query, query_lower=None):
+        """Handle common queries locally without using the LLM"""
+        # process_query only calls this when _ROUTER_RE found a local keyword
         
-        # Check for combined date and time queries
-        for pattern in combined_patterns:
-            if re.search(pattern, query_lower):
-                now = datetime.datetime.now()
-                return f"It's {now.strftime('%A, %B %d, %Y')}, and the current time is {now.strftime('%I:%M %p')}."
+        # Exact literal phrasings skip the regex; all of them are minute intents
+        if query_lower is None:
+            query_lower = query.lower()
+        intent = _LITERAL_INTENTS.get(query_lower.strip().rstrip("?.!"))
+        if intent:
+            return _minute_reply(intent)
         
-        # If no patterns match, return None to use the LLM
-        return None
+        if _LOCAL_GATE is not None and not _LOCAL_GATE.search(query):
+            return None
+        match = _LOCAL_RE.search(query)
+        if not match:
+            # If no patterns match, return None to use the LLM
+            return None
+        if match.lastgroup in _MINUTE_INTENTS:
+            return _minute_reply(match.lastgroup)
+        return _LOCAL_REPLIES[match.lastgroup](datetime.datetime.now(), match)
     
-    async def handle_list_command(self, query):
+    async def handle_list_command(self, query, query_lower=None):
         """Parse and handle list-related commands using SQLite ListManager"""
-        list_manager = ListManager()
+        list_manager = self.list_manager
         
         # Simple pattern matching for list commands
-        query = query.lower()
-        
-        # Helper functions (consider moving to a separate parsing module)
-        def _extract_list_name(q):
-            # Basic extraction, needs improvement for robustness
-            match = re.search(r"list ([a-zA-Z0-9_\- ]+)(?: list)?", q)
-            if match:
-                return match.group(1).strip()
-            
-            match = re.search(r"called ([a-zA-Z0-9_\- ]+)", q)
-            if match:
-                return match.group(1).strip()
-                
-            match = re.search(r"named ([a-zA-Z0-9_\- ]+)", q)
-            if match:
-                return match.group(1).strip()
-                
+        query = query_lower if query_lower is not None else query.lower()
+        # Every branch below needs "list" (process_query's router checks it too)
+        if "list" not in query:
             return None
-
-        def _extract_list_item(q):
-            # Basic extraction
-            match = re.search(r"add ([a-zA-Z0-9_\- ]+) to", q)
-            if match:
-                return match.group(1).strip()
-                
-            match = re.search(r"put ([a-zA-Z0-9_\- ]+) to", q)
-            if match:
-                return match.group(1).strip()
-                
-            return None
-            
+        
         # Create a new list
         if "create" in query and "list" in query:
             list_name = _extract_list_name(query)
             if not list_name:
                 # Try to infer from context if name wasn't explicit
-                match = re.search(r"create (?:a|an|the) ([a-zA-Z0-9_\- ]+) list", query)
+                match = _CREATE_LIST_RE.search(query)
                 list_name = match.group(1).strip() if match else None
             
             if not list_name:
@@ -299,7 +624,7 @@ class Assistant:
             list_name = _extract_list_name(query)
             if not list_name:
                 # Try to infer from context
-                match = re.search(r"(?:show|what's on|what is in) (?:my|the) ([a-zA-Z0-9_\- ]+) list", query)
+                match = _SHOW_LIST_RE.search(query)
                 list_name = match.group(1).strip() if match else None
                 
             if not list_name:
@@ -333,7 +658,7 @@ class Assistant:
                 
         # Remove from list (needs more robust parsing)
         # Example: "remove milk from my shopping list"
-        remove_match = re.search(r"remove (?:item )?([\w\s]+) from (?:my|the)? ([\w\s]+) list", query)
+        remove_match = "remove" in query and _REMOVE_ITEM_RE.search(query)
         if remove_match:
             item_to_remove = remove_match.group(1).strip()
             list_name = remove_match.group(2).strip()
@@ -354,7 +679,7 @@ class Assistant:
                 return f"I couldn't find '{item_to_remove}' on your '{list_name}' list."
 
         # Delete a list
-        delete_match = re.search(r"delete (?:my|the) ([\w\s]+) list", query)
+        delete_match = "delete" in query and _DELETE_LIST_RE.search(query)
         if delete_match:
             list_name = delete_match.group(1).strip()
             success = await list_manager.delete_list(list_name)
@@ -367,82 +692,39 @@ class Assistant:
     
     async def handle_reminder_command(self, query):
         """Parse and handle reminder-related commands using ReminderManager"""
-        reminder_manager = ReminderManager()
-        query = query.lower()
+        reminder_manager = self.reminder_manager
         
         # Set a timer (duration based)
-        timer_match = re.search(r'(set|create|start) (?:a|the)? timer (?:for|of) (\d+) (minute|minutes|min|mins|second|seconds|sec|secs|hour|hours|hr|hrs)', query)
+        timer_match = _TIMER_RE.search(query)
         if timer_match:
             value = int(timer_match.group(2))
-            unit = timer_match.group(3)
-            seconds = 0
-            if unit.startswith(('hour', 'hr')):
-                seconds = value * 3600
-            elif unit.startswith(('minute', 'min')):
-                seconds = value * 60
-            else:
-                seconds = value
+            for unit, multiplier in _TIMER_UNIT_SECONDS:
+                if timer_match.group(unit):
+                    seconds = value * multiplier
+                    break
             
             description = "Timer"
-            desc_match = re.search(r'(?:called|named|for) ([a-zA-Z0-9_\- ]+)', query)
+            desc_match = _TIMER_DESC_RE.search(query)
             if desc_match:
                 description = desc_match.group(1).strip()
             
             reminder = await reminder_manager.set_timer(seconds, description)
             if reminder:
-                due_time = datetime.datetime.fromisoformat(reminder["due_time"])
+                due_time = reminder["_due_dt"]
                 formatted_time = due_time.strftime("%H:%M:%S")
-                return f"Okay, I've set a {self._format_duration(seconds)} timer named '{description}'. I'll notify you at {formatted_time}."
+                return f"Okay, I've set a {_format_duration(seconds)} timer named '{description}'. I'll notify you at {formatted_time}."
             else:
                 return "Sorry, I couldn't set that timer."
 
         # Set a reminder (specific time based)
-        reminder_match = re.search(r'(?:remind|reminder|remember) me (?:to|about) (.+?) (?:at|on) (.+)', query, re.IGNORECASE)
-        if not reminder_match:
-            reminder_match = re.search(r'set a reminder (?:for|to|about) (.+?) (?:at|on) (.+)', query, re.IGNORECASE)
-            
+        reminder_match = _REMINDER_RE.search(query)
         if reminder_match:
             action = reminder_match.group(1).strip()
-            time_str = reminder_match.group(2).strip()
+            time_str = reminder_match.group(2).strip().lower()
             
             try:
-                # Simple time parsing for basic formats like "3:30"
                 now = datetime.datetime.now()
-                due_time = None
-                
-                # Handle "X:YY" format
-                if ":" in time_str:
-                    try:
-                        hour, minute = map(int, time_str.split(":"))
-                        due_time = now.replace(hour=hour, minute=minute)
-                        # If the time is in the past, assume next day
-                        if due_time < now:
-                            due_time += datetime.timedelta(days=1)
-                    except ValueError:
-                        pass
-                
-                # Handle words like "tomorrow"
-                if not due_time and "tomorrow" in time_str:
-                    # Extract time part if present
-                    time_parts = re.search(r'(\d+)(?::(\d+))?\s*(am|pm)?', time_str)
-                    if time_parts:
-                        hour = int(time_parts.group(1))
-                        minute = int(time_parts.group(2) or 0)
-                        am_pm = time_parts.group(3)
-                        
-                        # Adjust for PM
-                        if am_pm and am_pm.lower() == "pm" and hour < 12:
-                            hour += 12
-                        # Adjust for AM
-                        if am_pm and am_pm.lower() == "am" and hour == 12:
-                            hour = 0
-                            
-                        tomorrow = now + datetime.timedelta(days=1)
-                        due_time = tomorrow.replace(hour=hour, minute=minute)
-                    else:
-                        # Default to 9am tomorrow if no time specified
-                        tomorrow = now + datetime.timedelta(days=1)
-                        due_time = tomorrow.replace(hour=9, minute=0)
+                due_time = parse_reminder_time(time_str, now)
                 
                 # If we couldn't parse the time, give a helpful message
                 if not due_time:
@@ -450,32 +732,30 @@ class Assistant:
 
                 reminder = await reminder_manager.set_reminder(due_time.isoformat(), action)
                 if reminder:
-                    formatted_time = due_time.strftime("%I:%M %p on %A")
+                    formatted_time = due_time.strftime(REMINDER_LIST_FMT)
                     return f"Okay, I'll remind you about '{action}' at {formatted_time}."
                 else:
                     return "Sorry, I couldn't set that reminder."
             except Exception as e:
-                logger.error(f"Error parsing time for reminder: {e}")
+                logger.error("Error parsing time for reminder: %s", e)
                 return "I had trouble understanding that time. Could you phrase it differently? (e.g., '3:30pm', 'tomorrow at 9am')"
 
         # List reminders
-        list_pattern = r'(show|list|what|tell me about|any) (?:my|are my|do i have)? ?(?:active )?(reminders|timers)'
-        if re.search(list_pattern, query):
+        if _LIST_REMINDERS_RE.search(query):
             reminders = await reminder_manager.get_reminders()
             if not reminders:
                 return "You don't have any active reminders or timers set."
             
-            response = "Here are your active reminders and timers:\n"
+            lines = ["Here are your active reminders and timers:"]
             for i, r in enumerate(reminders):
-                due_time = datetime.datetime.fromisoformat(r["due_time"])
-                formatted_time = due_time.strftime("%I:%M %p on %A")
+                formatted_time = _format_due_time(r["_due_dt"])
                 r_type = r["type"].capitalize()
-                response += f"{i+1}. {r_type}: {r['description']} at {formatted_time} (ID: {r['id']})\n"
+                lines.append(f"{i+1}. {r_type}: {r['description']} at {formatted_time} (ID: {r['id']})")
             
-            return response
+            return "\n".join(lines) + "\n"
             
         # Cancel reminder (basic matching by description or ID)
-        cancel_match = re.search(r'(?:cancel|delete|remove) (?:the|my)? (?:reminder|timer) (?:for|called|named|with id) ([a-zA-Z0-9_\- ]+)', query)
+        cancel_match = _CANCEL_REMINDER_RE.search(query)
         if cancel_match:
             identifier = cancel_match.group(1).strip()
             reminders = await reminder_manager.get_reminders()
@@ -504,32 +784,36 @@ class Assistant:
 
         return None  # Not a reminder command
     
+    def _get_search_manager(self):
+        """Return the shared WebSearchManager, creating it on first use"""
+        # Not cached on failure (e.g. missing API key) so a later query can retry
+        if self._search_manager is None:
+            from rin.search import WebSearchManager
+            self._search_manager = WebSearchManager()
+        return self._search_manager
+    
+    def _get_draft_creator(self):
+        """Return the shared EmailDraftCreator, creating it on first use"""
+        if self._draft_creator is None:
+            from rin.email_drafts import EmailDraftCreator
+            self._draft_creator = EmailDraftCreator()
+        return self._draft_creator
+    
     async def handle_search_command(self, query):
         """Handle web search related commands using WebSearchManager"""
-        from rin.search import WebSearchManager
-        
         # Check if this is a search query
-        search_patterns = [
-            r"search (?:for|about) (.+)",
-            r"look up (.+)",
-            r"find (?:information|info) (?:about|on) (.+)",
-            r"what is (.+)",
-            r"who is (.+)",
-            r"tell me about (.+)"
-        ]
-        
-        for pattern in search_patterns:
-            match = re.search(pattern, query.lower())
+        for pattern in _SEARCH_RES:
+            match = pattern.search(query)
             if match:
                 search_query = match.group(1).strip()
-                logger.info(f"Handling search query: '{search_query}'")
+                logger.info("Handling search query: '%s'", search_query)
                 
                 # Perform the search and summarize
                 try:
-                    search_manager = WebSearchManager()
+                    search_manager = self._get_search_manager()
                     result = await search_manager.search_and_summarize(search_query)
                 except Exception as e:
-                     logger.error(f"Failed to instantiate or use WebSearchManager: {e}", exc_info=True)
+                     logger.error("Failed to instantiate or use WebSearchManager: %s", e, exc_info=True)
                      return "Sorry, I'm having trouble with my search capability right now."
 
                 if "error" in result:
@@ -548,33 +832,23 @@ class Assistant:
     
     async def handle_email_command(self, query):
         """Parse and handle email-related commands using SQLite EmailDraftCreator"""
-        from rin.email_drafts import EmailDraftCreator
-        
         # Check if this is an email draft request
-        email_patterns = [
-            r"(?:write|draft|compose) (?:an |a )?email (?:to|for) (.+?) (?:about|regarding|re:|on) (.+)",
-            r"help me (?:write|draft|compose) (?:an |a )?email (?:to|for) (.+?) (?:about|regarding|re:|on) (.+)",
-            r"create (?:an |a )?email (?:to|for) (.+?) (?:about|regarding|re:|on) (.+)"
-        ]
-        
-        for pattern in email_patterns:
-            match = re.search(pattern, query.lower())
+        for pattern in _EMAIL_RES:
+            match = pattern.search(query)
             if match:
                 recipient = match.group(1).strip()
                 topic = match.group(2).strip()
                 
-                # Extract tone if specified
-                tone = "professional"  # default
-                tone_match = re.search(r"in a (professional|formal|casual|friendly|informal) tone", query.lower())
-                if tone_match:
-                    tone = tone_match.group(1)
+                # Extract tone if specified, defaulting to professional
+                tone_match = _TONE_RE.search(query)
+                tone = tone_match.group(1).lower() if tone_match else "professional"
                 
                 # Create email draft using the EmailDraftCreator
                 try:
-                    draft_creator = EmailDraftCreator()
+                    draft_creator = self._get_draft_creator()
                     draft = await draft_creator.create_draft(recipient, topic, query, tone)
                 except Exception as e:
-                    logger.error(f"Failed to instantiate or use EmailDraftCreator: {e}", exc_info=True)
+                    logger.error("Failed to instantiate or use EmailDraftCreator: %s", e, exc_info=True)
                     return "Sorry, I'm having trouble with my email drafting capability right now."
 
                 if "error" in draft or not draft:
@@ -583,55 +857,52 @@ class Assistant:
                 return f"I've drafted an email to {recipient} about {topic}. Here it is:\n\n{draft['content']}\n\n(Saved to database with ID: {draft['id']})"
         
         # List drafts (from database)
-        if re.search(r"(show|list|what) (?:are |my )?email drafts", query.lower()):
+        if _LIST_DRAFTS_RE.search(query):
             try:
-                draft_creator = EmailDraftCreator()
+                draft_creator = self._get_draft_creator()
                 drafts = await draft_creator.get_drafts()
             except Exception as e:
-                logger.error(f"Failed to get drafts: {e}", exc_info=True)
+                logger.error("Failed to get drafts: %s", e, exc_info=True)
                 return "Sorry, I couldn't retrieve your email drafts right now."
 
             if not drafts:
                 return "You don't have any email drafts saved in the database."
             
-            response = "Here are your recent email drafts from the database:\n"
+            lines = ["Here are your recent email drafts from the database:"]
             for i, draft in enumerate(drafts[:5]):  # Show at most 5
-                created_at_str = draft.get("created_at", "Unknown")
-                try:
-                    created_dt = datetime.datetime.fromisoformat(created_at_str)
-                    created_at_display = created_dt.strftime("%b %d %H:%M")
-                except:
-                    created_at_display = "??"
-                response += f"{i+1}. To: {draft['recipient']} - Subject: {draft['subject']} ({created_at_display}, ID: {draft['id']})\n"
+                created_at_display = _format_draft_time(draft.get("created_at", "Unknown"))
+                lines.append(f"{i+1}. To: {draft['recipient']} - Subject: {draft['subject']} ({created_at_display}, ID: {draft['id']})")
             
-            return response
+            return "\n".join(lines) + "\n"
         
         return None  # Not an email-related command
     
-    def _format_duration(self, seconds):
-        """Format a duration in seconds to a human-readable string"""
-        if seconds < 60:
-            return f"{seconds} second{'s' if seconds != 1 else ''}"
-        elif seconds < 3600:
-            minutes = seconds // 60
-            return f"{minutes} minute{'s' if minutes != 1 else ''}"
-        else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            if minutes == 0:
-                return f"{hours} hour{'s' if hours != 1 else ''}"
-            else:
-                return f"{hours} hour{'s' if hours != 1 else ''} and {minutes} minute{'s' if minutes != 1 else ''}"
+    async def speak_stream(self, text):
+        """Synthesize text a sentence at a time, yielding each sentence's audio as it is ready"""
+        sentences = [s for s in _SENTENCE_END_RE.split(text.strip()) if s]
+        stream = self.tts.synthesize_stream(sentences)
+        try:
+            async for sentence, audio_path in stream:
+                yield {"text_partial": sentence, "audio_chunk": audio_path}
+        finally:
+            await stream.aclose()
     
-    async def listen_and_respond(self):
-        """Record from microphone, convert to text, and respond"""
+    async def listen_and_respond(self, respond_with_voice=True, stream=False):
+        """Record from microphone, convert to text, and respond
+        
+        With stream (and voice), the result carries "parts": the respond_stream
+        generator, which the caller iterates to speak the reply as it arrives.
+        """
         try:
             logger.info("Listening for speech input")
             query = await self.stt.transcribe_from_mic()
             if not query:
                 return {"error": "Could not understand audio"}
+            
+            if stream and respond_with_voice:
+                return {"query": query, "parts": self.respond_stream(query)}
                 
-            result = await self.process_query(query, respond_with_voice=True)
+            result = await self.process_query(query, respond_with_voice=respond_with_voice)
             result["query"] = query  # Include the transcribed query in the result
             return result
         except Exception as e:
@@ -1,27 +1,45 @@
 import os
-import json
+import secrets
 import aiosqlite
 import asyncio
 import datetime
 import logging
 from pathlib import Path
 from rin.config import RIN_DIR
+from rin.storage import SharedConnection
 from rin.logging_config import loggers
-from rin.llm import LLMInterface
 
 logger = loggers.get('core', logging.getLogger('rin.email'))
 
 class EmailDraftCreator:
     """Create and manage email drafts using SQLite"""
     
+    # Class-level, like the table it stands for: created once per process
+    _db_ready = False
+    
     def __init__(self):
         self.db_path = RIN_DIR / "rin.db"
-        self.llm = LLMInterface.create()
+        self._llm = None
+        self._db = SharedConnection(self.db_path, row_factory=aiosqlite.Row)  # drafts are returned as dicts
         logger.info(f"Email Draft Creator initialized, using DB at {self.db_path}")
+    
+    @property
+    def llm(self):
+        """Create the LLM client on first draft, so listing/showing drafts skips it"""
+        if self._llm is None:
+            from rin.llm import LLMInterface
+            self._llm = LLMInterface.create()
+        return self._llm
 
+    async def aclose(self):
+        """Close the creator's connection"""
+        await self._db.aclose()
+    
     async def _init_db(self):
-        """Ensure the email_drafts table exists"""
-        async with aiosqlite.connect(self.db_path) as db:
+        """Ensure the email_drafts table exists (the DDL runs once per process)"""
+        if self._db_ready:
+            return
+        async with self._db.acquire() as db:
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS email_drafts (
                     id TEXT PRIMARY KEY,
@@ -33,54 +51,77 @@ class EmailDraftCreator:
                     prompt TEXT
                 )
             ''')
+            # get_drafts lists newest first
+            await db.execute('CREATE INDEX IF NOT EXISTS idx_email_drafts_created ON email_drafts (created_at)')
             await db.commit()
+        type(self)._db_ready = True
 
     async def create_draft(self, recipient, subject, prompt, tone="professional"):
         """Create an email draft from a prompt and save to DB"""
+        drafts = await self.create_drafts([
+            {"recipient": recipient, "subject": subject, "prompt": prompt, "tone": tone}
+        ])
+        return drafts[0]
+    
+    async def create_drafts(self, specs):
+        """Create several drafts with one LLM call and one commit
+        
+        Each spec is a dict with recipient, subject, prompt and optional tone.
+        Returns the saved drafts in spec order, or [{"error": ...}] on failure.
+        """
+        if not specs:
+            return []
         await self._init_db()
         try:
-            # Generate email content using LLM
-            content = await self._generate_email_content(recipient, subject, prompt, tone)
+            if len(specs) == 1:
+                spec = specs[0]
+                contents = [await self._generate_email_content(
+                    spec["recipient"], spec["subject"], spec["prompt"], spec.get("tone", "professional")
+                )]
+            else:
+                contents = await self._generate_email_contents(specs)
             
-            # Create the draft ID and timestamp
+            # Create the draft IDs and timestamp
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            draft_id = f"email_{timestamp}_{hash(prompt) % 10000}" # Simple hash for uniqueness
             created_at = str(datetime.datetime.now())
             
-            draft = {
-                "id": draft_id,
-                "recipient": recipient,
-                "subject": subject,
-                "content": content,
-                "created_at": created_at,
-                "tone": tone,
-                "prompt": prompt
-            }
+            drafts = [
+                {
+                    "id": f"email_{timestamp}_{secrets.token_hex(4)}", # Random suffix for uniqueness
+                    "recipient": spec["recipient"],
+                    "subject": spec["subject"],
+                    "content": content,
+                    "created_at": created_at,
+                    "tone": spec.get("tone", "professional"),
+                    "prompt": spec["prompt"]
+                }
+                for spec, content in zip(specs, contents)
+            ]
             
-            # Save the draft to SQLite
-            async with aiosqlite.connect(self.db_path) as db:
-                 await db.execute(
-                     'INSERT INTO email_drafts (id, recipient, subject, content, created_at, tone, prompt) VALUES (?, ?, ?, ?, ?, ?, ?)',
-                     (draft["id"], draft["recipient"], draft["subject"], draft["content"], 
-                      draft["created_at"], draft["tone"], draft["prompt"])
-                 )
-                 await db.commit()
+            # Save the drafts to SQLite
+            async with self._db.acquire() as db:
+                await db.executemany(
+                    'INSERT INTO email_drafts (id, recipient, subject, content, created_at, tone, prompt) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(d["id"], d["recipient"], d["subject"], d["content"],
+                      d["created_at"], d["tone"], d["prompt"]) for d in drafts]
+                )
+                await db.commit()
             
-            logger.info(f"Saved email draft {draft_id}")
-            return draft
+            logger.info(f"Saved email drafts {', '.join(d['id'] for d in drafts)}")
+            return drafts
         except Exception as e:
-            logger.error(f"Error creating email draft: {str(e)}", exc_info=True)
-            return {"error": str(e)}
+            logger.error(f"Error creating email drafts: {str(e)}", exc_info=True)
+            return [{"error": str(e)}]
     
     async def get_drafts(self):
         """Get all email drafts from DB"""
         await self._init_db()
         drafts = []
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._db.acquire() as db:
                 cursor = await db.execute('SELECT * FROM email_drafts ORDER BY created_at DESC')
                 rows = await cursor.fetchall()
-                drafts = [dict(zip([c[0] for c in cursor.description], row)) for row in rows]
+                drafts = [dict(row) for row in rows]
             return drafts
         except Exception as e:
             logger.error(f"Error getting email drafts: {str(e)}")
@@ -90,11 +131,11 @@ class EmailDraftCreator:
         """Get a specific draft by ID from DB"""
         await self._init_db()
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._db.acquire() as db:
                 cursor = await db.execute('SELECT * FROM email_drafts WHERE id = ?', (draft_id,))
                 row = await cursor.fetchone()
                 if row:
-                    return dict(zip([c[0] for c in cursor.description], row))
+                    return dict(row)
                 else:
                     logger.warning(f"Draft {draft_id} not found in DB")
                     return None
@@ -106,7 +147,7 @@ class EmailDraftCreator:
         """Delete a draft by ID from DB"""
         await self._init_db()
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._db.acquire() as db:
                 cursor = await db.execute('DELETE FROM email_drafts WHERE id = ?', (draft_id,))
                 await db.commit()
                 if cursor.rowcount > 0:
@@ -134,4 +175,29 @@ class EmailDraftCreator:
         
         # Generate the content
         content = await self.llm.generate_response(email_prompt)
-        return content 
\ No newline at end of file
+        return content
+    
+    async def _generate_email_contents(self, specs):
+        """Generate the bodies for several emails with a single LLM request"""
+        emails = "\n".join(
+            f"{i+1}. A {spec.get('tone', 'professional')} email to {spec['recipient']} "
+            f"with the subject \"{spec['subject']}\". Details to include: {spec['prompt']}"
+            for i, spec in enumerate(specs)
+        )
+        batch_prompt = f"""
+        Write the following {len(specs)} emails:
+        {emails}
+        
+        Format each email properly with greeting, body paragraphs, and sign-off.
+        Respond with only a JSON array of {len(specs)} objects, in the same order,
+        each with the fields "recipient", "subject" and "body". The body must not
+        include the "To:", "From:", or "Subject:" lines.
+        """
+        
+        return await self.llm.generate_batch(
+            batch_prompt, len(specs), lambda email: str(email["body"]),
+            lambda i: self._generate_email_content(
+                specs[i]["recipient"], specs[i]["subject"], specs[i]["prompt"], specs[i].get("tone", "professional")
+            ),
+            what="emails",
+        )
@@ -1,9 +1,10 @@
 import json
 import aiosqlite
-import asyncio
+import itertools
 import logging
 from pathlib import Path
 from rin.config import RIN_DIR
+from rin.storage import SharedConnection
 from rin.logging_config import loggers
 import datetime
 
@@ -12,46 +13,127 @@ logger = loggers.get('core', logging.getLogger('rin.lists'))
 class ListManager:
     """SQLite-based list manager using aiosqlite"""
     
+    # Class-level, so the DDL and the JSON migration check run once per process
+    _db_ready = False
+    
     def __init__(self):
         self.db_path = RIN_DIR / "rin.db" # Use the main database file
+        self._db = SharedConnection(self.db_path)
         logger.info(f"List Manager initialized, using DB at {self.db_path}")
     
+    async def aclose(self):
+        """Close the manager's connection"""
+        await self._db.aclose()
+    
+    async def prewarm(self):
+        """Open the connection and create the tables ahead of the first list command"""
+        await self._init_db()
+    
     async def _init_db(self):
-        """Ensure the lists table exists"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
+        """Ensure the lists tables exist (the DDL runs once per process)"""
+        if self._db_ready:
+            return
+        async with self._db.acquire() as db:
+            await db.executescript('''
                 CREATE TABLE IF NOT EXISTS lists (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT NOT NULL,
-                    items TEXT NOT NULL, -- Store items as JSON string
+                    items TEXT NOT NULL DEFAULT '[]', -- legacy JSON column, superseded by list_items
                     created_at TEXT NOT NULL,
                     UNIQUE(name)
-                )
+                );
+                CREATE TABLE IF NOT EXISTS list_items (
+                    list_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    item TEXT NOT NULL,
+                    PRIMARY KEY(list_id, position)
+                );
             ''')
+            # Decided by the data rather than by whether list_items exists, so a
+            # migration that was interrupted or skipped a list resumes next time
+            await self._migrate_json_items(db)
             await db.commit()
+        type(self)._db_ready = True
+    
+    async def _migrate_json_items(self, db):
+        """Move items still in the old JSON column into list_items, one list at a time"""
+        cursor = await db.execute("SELECT id, name, items FROM lists WHERE items != '[]'")
+        rows = await cursor.fetchall()
+        migrated = 0
+        for list_id, name, items_json in rows:
+            try:
+                items = json.loads(items_json)
+                if not isinstance(items, list):
+                    raise ValueError("not a JSON array")
+            except (TypeError, ValueError):
+                logger.error(f"Error decoding items for list '{name}', skipping migration")
+                continue
+            # item is NOT NULL TEXT: nulls are dropped, other values stored as text
+            items = [item if isinstance(item, str) else str(item) for item in items if item is not None]
+            # A savepoint per list, so a failing list keeps its JSON and the rest still move
+            await db.execute("SAVEPOINT migrate_list")
+            try:
+                # Appended after anything already added to list_items for this list
+                cursor = await db.execute(
+                    'SELECT COALESCE(MAX(position) + 1, 0) FROM list_items WHERE list_id = ?', (list_id,)
+                )
+                (start,) = await cursor.fetchone()
+                await db.executemany(
+                    'INSERT INTO list_items (list_id, position, item) VALUES (?, ?, ?)',
+                    [(list_id, position, item) for position, item in enumerate(items, start)]
+                )
+                await db.execute("UPDATE lists SET items = '[]' WHERE id = ?", (list_id,))
+                await db.execute("RELEASE migrate_list")
+                migrated += 1
+            except aiosqlite.Error as e:
+                await db.execute("ROLLBACK TO migrate_list")
+                await db.execute("RELEASE migrate_list")
+                logger.error(f"Error migrating items for list '{name}': {str(e)}")
+        if migrated:
+            logger.info(f"Migrated {migrated} lists to the list_items table")
     
     async def get_lists(self):
         """Get all available list names"""
         await self._init_db()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._db.acquire() as db:
             cursor = await db.execute('SELECT name FROM lists')
             rows = await cursor.fetchall()
             return [row[0] for row in rows]
     
+    async def get_all_lists_with_items(self):
+        """Get every list and its items in one query, as {name: [items...]}"""
+        await self._init_db()
+        async with self._db.acquire() as db:
+            cursor = await db.execute(
+                '''SELECT lists.name, list_items.item FROM lists
+                   LEFT JOIN list_items ON list_items.list_id = lists.id
+                   ORDER BY lists.name, list_items.position'''
+            )
+            rows = await cursor.fetchall()
+        return {
+            name: [item for _, item in group if item is not None]
+            for name, group in itertools.groupby(rows, key=lambda row: row[0])
+        }
+    
     async def create_list(self, name, items=None):
         """Create a new list with optional initial items"""
         await self._init_db()
         if items is None:
             items = []
         
-        items_json = json.dumps(items)
         created_at = str(datetime.datetime.now())
         
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    'INSERT INTO lists (name, items, created_at) VALUES (?, ?, ?)',
-                    (name, items_json, created_at)
+            async with self._db.acquire() as db:
+                # items is set explicitly: tables from before list_items have no default for it
+                cursor = await db.execute(
+                    "INSERT INTO lists (name, items, created_at) VALUES (?, '[]', ?)",
+                    (name, created_at)
+                )
+                list_id = cursor.lastrowid
+                await db.executemany(
+                    'INSERT INTO list_items (list_id, position, item) VALUES (?, ?, ?)',
+                    [(list_id, position, item) for position, item in enumerate(items)]
                 )
                 await db.commit()
             logger.info(f"Created list '{name}' with {len(items)} items")
@@ -66,34 +148,36 @@ class ListManager:
     async def get_list(self, name):
         """Get a specific list by name, returning items"""
         await self._init_db()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute('SELECT items FROM lists WHERE name = ?', (name,))
-            row = await cursor.fetchone()
-            if row:
-                try:
-                    return json.loads(row[0]) # Return only the items list
-                except json.JSONDecodeError:
-                    logger.error(f"Error decoding items for list '{name}'")
-                    return None
-            else:
+        async with self._db.acquire() as db:
+            # An empty list still yields one row, with a NULL item
+            cursor = await db.execute(
+                '''SELECT list_items.item FROM lists
+                   LEFT JOIN list_items ON list_items.list_id = lists.id
+                   WHERE lists.name = ? ORDER BY list_items.position''',
+                (name,)
+            )
+            rows = await cursor.fetchall()
+            if not rows:
                 logger.warning(f"List '{name}' not found")
                 return None
+            return [row[0] for row in rows if row[0] is not None]
     
     async def add_item(self, list_name, item):
         """Add an item to a list"""
         await self._init_db()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute('SELECT items FROM lists WHERE name = ?', (list_name,))
-            row = await cursor.fetchone()
-            if not row:
-                logger.warning(f"List '{list_name}' not found for adding item")
-                return False
-            
+        async with self._db.acquire() as db:
             try:
-                items = json.loads(row[0])
-                items.append(item)
-                items_json = json.dumps(items)
-                await db.execute('UPDATE lists SET items = ? WHERE name = ?', (items_json, list_name))
+                # GROUP BY makes an unknown list produce no row, so nothing is inserted
+                cursor = await db.execute(
+                    '''INSERT INTO list_items (list_id, position, item)
+                       SELECT lists.id, COALESCE(MAX(list_items.position) + 1, 0), ?
+                       FROM lists LEFT JOIN list_items ON list_items.list_id = lists.id
+                       WHERE lists.name = ? GROUP BY lists.id''',
+                    (item, list_name)
+                )
+                if cursor.rowcount == 0:
+                    logger.warning(f"List '{list_name}' not found for adding item")
+                    return False
                 await db.commit()
                 logger.info(f"Added item to '{list_name}': {item}")
                 return True
@@ -101,28 +185,55 @@ class ListManager:
                 logger.error(f"Error adding item to list '{list_name}': {str(e)}")
                 return False
     
+    async def add_items(self, list_name, items):
+        """Add several items to a list in one transaction"""
+        await self._init_db()
+        async with self._db.acquire() as db:
+            try:
+                cursor = await db.execute(
+                    '''SELECT lists.id, COALESCE(MAX(list_items.position) + 1, 0)
+                       FROM lists LEFT JOIN list_items ON list_items.list_id = lists.id
+                       WHERE lists.name = ? GROUP BY lists.id''',
+                    (list_name,)
+                )
+                row = await cursor.fetchone()
+                if not row:
+                    logger.warning(f"List '{list_name}' not found for adding items")
+                    return False
+                list_id, start = row
+                await db.executemany(
+                    'INSERT INTO list_items (list_id, position, item) VALUES (?, ?, ?)',
+                    [(list_id, position, item) for position, item in enumerate(items, start)]
+                )
+                await db.commit()
+                logger.info(f"Added {len(items)} items to '{list_name}'")
+                return True
+            except Exception as e:
+                logger.error(f"Error adding items to list '{list_name}': {str(e)}")
+                return False
+    
     async def remove_item(self, list_name, item_index):
         """Remove an item from a list by index"""
         await self._init_db()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute('SELECT items FROM lists WHERE name = ?', (list_name,))
-            row = await cursor.fetchone()
-            if not row:
-                logger.warning(f"List '{list_name}' not found for removing item")
-                return False
-            
+        if item_index < 0:
+            logger.warning(f"Invalid item index {item_index} for list '{list_name}'")
+            return False
+        async with self._db.acquire() as db:
             try:
-                items = json.loads(row[0])
-                if 0 <= item_index < len(items):
-                    removed = items.pop(item_index)
-                    items_json = json.dumps(items)
-                    await db.execute('UPDATE lists SET items = ? WHERE name = ?', (items_json, list_name))
-                    await db.commit()
-                    logger.info(f"Removed item from '{list_name}': {removed}")
-                    return True
-                else:
+                # Positions keep gaps after removals, so the index is an offset in position order
+                cursor = await db.execute(
+                    '''DELETE FROM list_items WHERE (list_id, position) = (
+                           SELECT list_items.list_id, list_items.position
+                           FROM list_items JOIN lists ON lists.id = list_items.list_id
+                           WHERE lists.name = ? ORDER BY list_items.position LIMIT 1 OFFSET ?)''',
+                    (list_name, item_index)
+                )
+                if cursor.rowcount == 0:
                     logger.warning(f"Invalid item index {item_index} for list '{list_name}'")
                     return False
+                await db.commit()
+                logger.info(f"Removed item #{item_index} from '{list_name}'")
+                return True
             except Exception as e:
                 logger.error(f"Error removing item from list '{list_name}': {str(e)}")
                 return False
@@ -130,7 +241,11 @@ class ListManager:
     async def delete_list(self, name):
         """Delete a list entirely"""
         await self._init_db()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._db.acquire() as db:
+            await db.execute(
+                'DELETE FROM list_items WHERE list_id IN (SELECT id FROM lists WHERE name = ?)',
+                (name,)
+            )
             cursor = await db.execute('DELETE FROM lists WHERE name = ?', (name,))
             await db.commit()
             if cursor.rowcount > 0:
@@ -138,4 +253,4 @@ class ListManager:
                 return True
             else:
                 logger.warning(f"List '{name}' not found for deletion")
-                return False 
\ No newline at end of file
+                return False
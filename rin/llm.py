@@ -1,6 +1,8 @@
 import os
+import json
 import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
 from rin.config import OPENAI_API_KEY, LLM_MODEL, SYSTEM_PROMPT
 from rin.logging_config import loggers
@@ -23,6 +25,34 @@ class LLMInterface(ABC):
     async def generate_response(self, query):
         """Generate a response to the given query"""
         pass
+    
+    async def generate_response_stream(self, query):
+        """Yield the response as text deltas (a single delta unless a provider overrides it)"""
+        yield await self.generate_response(query)
+    
+    async def generate_batch(self, prompt, count, parse_item, fallback, what="items"):
+        """Return count results from one request whose reply is a JSON array
+        
+        Each element goes through parse_item. If the reply isn't an array of
+        count elements it accepts, the results come from fallback(i) for each
+        index instead, awaited concurrently.
+        """
+        # An empty or failed (None) reply falls through to the fallback
+        response = await self.generate_response(prompt) or ""
+        try:
+            # Tolerate a ```json fence or a sentence around the array
+            parsed = json.loads(response[response.index("["):response.rindex("]") + 1])
+            if len(parsed) == count:
+                return [parse_item(item) for item in parsed]
+            logger.warning(f"Batched reply had {len(parsed)} {what}, expected {count}")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Could not parse batched {what} reply: {str(e)}")
+        
+        return await asyncio.gather(*(fallback(i) for i in range(count)))
+    
+    async def prewarm(self):
+        """Open connections ahead of first use (no-op unless a provider overrides it)"""
+        pass
 
 class OpenAIClient(LLMInterface):
     def __init__(self):
@@ -32,10 +62,65 @@ class OpenAIClient(LLMInterface):
         self.model = LLM_MODEL
         logger.info(f"Initialized OpenAI client with model {self.model}")
     
+    async def prewarm(self):
+        """Open the HTTPS connection with a cheap model lookup"""
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, lambda: self.client.models.retrieve(self.model))
+            logger.debug("OpenAI connection warmed up")
+        except Exception as e:
+            logger.warning(f"OpenAI prewarm failed: {str(e)}")
+    
+    async def generate_response_stream(self, query):
+        """Yield the response's text deltas as OpenAI streams them"""
+        logger.info("Streaming response for query using %s", self.model)
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue()
+        done = object()
+        stop = threading.Event()  # set if the caller stops reading early
+        
+        def consume():
+            # The blocking stream is read on an executor thread and handed to the loop
+            try:
+                stream = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": query}
+                    ],
+                    temperature=0.7,
+                    max_tokens=500,
+                    stream=True
+                )
+                with stream:
+                    for chunk in stream:
+                        if stop.is_set():
+                            break
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            loop.call_soon_threadsafe(queue.put_nowait, delta)
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+        
+        reader = loop.run_in_executor(None, consume)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    logger.error(f"Error streaming response: {str(item)}")
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            await reader
+    
     async def generate_response(self, query):
         """Asynchronously generate a response using OpenAI"""
         try:
-            logger.info(f"Generating response for query using {self.model}")
+            logger.info("Generating response for query using %s", self.model)
             
             # Run in executor to avoid blocking
             loop = asyncio.get_event_loop()
@@ -53,7 +138,7 @@ class OpenAIClient(LLMInterface):
             )
             
             content = response.choices[0].message.content
-            logger.debug(f"Generated response: {content[:50]}...")
+            logger.debug("Generated response: %.50s...", content)
             return content
         except Exception as e:
             logger.error(f"Error generating response: {str(e)}", exc_info=True)
@@ -1,22 +1,39 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from rin.config import LOG_DIR, LOG_LEVEL
 
+# Started by setup_logging; writes the queued records to the log file on its own thread
+listener = None
+
 def setup_logging():
+    global listener
     log_file = LOG_DIR / "rin.log"
     
     # Configure logging
     log_level = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
     
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Only the file writes go through the listener thread, so callers (often
+    # the event loop) don't block on disk. Console output stays on the calling
+    # thread so it interleaves in order with the CLI's own click.echo output.
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # prepare() bakes the message into the record; the final format is the listener's
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logging.basicConfig(level=log_level, handlers=[queue_handler, console_handler])
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    # Stopping drains the queue, so records logged just before exit still get written
+    atexit.register(listener.stop)
     
     # Create specific loggers
     loggers = {
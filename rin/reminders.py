@@ -2,85 +2,280 @@ import json
 import aiosqlite
 import asyncio
 import datetime
+import functools
+import heapq
+import itertools
 import platform
 import logging
+import re
 import time
 from pathlib import Path
+from dateutil import parser as date_parser
 from rin.config import RIN_DIR
+from rin.storage import SharedConnection
 from rin.logging_config import loggers
-from rin.tts import TTSInterface
 
 logger = loggers.get('core', logging.getLogger('rin.reminders'))
 
+# How due times are shown in reminder listings, by the CLI and the assistant alike
+REMINDER_LIST_FMT = "%I:%M %p on %A"
+
+# Every get_reminders() re-reads the same active rows; datetimes are immutable,
+# so each due_time string is parsed once and the result shared
+_parse_due = functools.lru_cache(maxsize=1024)(datetime.datetime.fromisoformat)
+
+# Statements shared by several call sites; identical text lets sqlite3 reuse the
+# statement it prepared on the persistent connection for every later call
+_INSERT_SQL = '''INSERT INTO reminders
+    (id, type, description, created_at, due_time, due_time_ms, duration_seconds, completed)
+    VALUES (:id, :type, :description, :created_at, :due_time, :due_time_ms, :duration_seconds, :completed)'''
+_MARK_COMPLETED_SQL = 'UPDATE reminders SET completed = 1 WHERE id = ? AND completed = 0'
+
+def _epoch_ms(dt):
+    """Convert a (naive, local) datetime to the integer epoch-ms stored in due_time_ms"""
+    return int(dt.timestamp() * 1000)
+
+# Spoken and typed reminder times ("5pm", "friday", "tomorrow at 2", "next monday")
+_ONE_DAY = datetime.timedelta(days=1)
+_ONE_WEEK = datetime.timedelta(weeks=1)
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_TOMORROW_WORD_RE = re.compile(r'(?i)\btomorrow\b')
+_NEXT_WEEKDAY_RE = re.compile(r'(?i)^next\s+(' + "|".join(_WEEKDAYS) + r')\b\s*(.*)$')
+_NOON_RE = re.compile(r'(?i)\bnoon\b')
+_MIDNIGHT_RE = re.compile(r'(?i)\bmidnight\b')
+_BARE_HOUR_RE = re.compile(r'^(?:at\s+)?(\d{1,2})$')
+_WEEKDAY_NAME_RE = re.compile(r'(?i)\b(?:' + "|".join(_WEEKDAYS) + r')\b')
+# Two defaults that differ in year, month and day: a field a reminder time
+# states comes out the same under both
+_PROBE_DEFAULTS = (datetime.datetime(2000, 1, 1), datetime.datetime(2001, 2, 2))
+
+def _stated_date_fields(time_str):
+    """The date fields (year, month, day) time_str gives itself rather than taking from the default"""
+    first, second = (date_parser.parse(time_str, default=default) for default in _PROBE_DEFAULTS)
+    return {field for field in ("year", "month", "day") if getattr(first, field) == getattr(second, field)}
+
+def parse_reminder_time(time_str, now):
+    """Parse a reminder time like '3:30', '5pm', 'friday' or 'tomorrow at 2pm'; None if unparseable"""
+    # dateutil has no relative words, so "tomorrow" only moves the base date
+    tomorrow = _TOMORROW_WORD_RE.search(time_str)
+    if tomorrow:
+        time_str = _TOMORROW_WORD_RE.sub(" ", time_str).strip()
+    base = now + _ONE_DAY if tomorrow else now
+    # Fields the string leaves out come from here: a bare date means 9am
+    default = base.replace(hour=9, minute=0, second=0, microsecond=0)
+    if not time_str:
+        return default if tomorrow else None
+    # dateutil knows neither word
+    time_str = _MIDNIGHT_RE.sub("00:00", _NOON_RE.sub("12:00", time_str))
+    # "next friday" is the first friday after today, so a week out on a friday;
+    # whatever follows it ("at 3pm") is parsed against that day
+    next_day = _NEXT_WEEKDAY_RE.match(time_str)
+    if next_day:
+        days_ahead = (_WEEKDAYS.index(next_day.group(1).lower()) - now.weekday() - 1) % 7 + 1
+        default = (now + datetime.timedelta(days=days_ahead)).replace(hour=9, minute=0, second=0, microsecond=0)
+        time_str = next_day.group(2)
+        if not time_str:
+            return default
+    # dateutil reads a lone number as a day of the month; here it is an hour
+    bare_hour = _BARE_HOUR_RE.match(time_str)
+    if bare_hour:
+        time_str = bare_hour.group(1) + ":00"
+    try:
+        due_time = date_parser.parse(time_str, default=default)
+        # A time already past means its next occurrence: a date without a year
+        # is next year's, a weekday next week's, a bare time of day tomorrow's
+        if due_time <= now and not (tomorrow or next_day):
+            stated = _stated_date_fields(time_str)
+            if stated:
+                if "year" not in stated:
+                    due_time = due_time.replace(year=due_time.year + 1)
+            elif _WEEKDAY_NAME_RE.search(time_str):
+                due_time += _ONE_WEEK
+            else:
+                due_time += _ONE_DAY
+    except (ValueError, OverflowError):
+        return None
+    return due_time
+
 class ReminderManager:
     """Manages timers and reminders using SQLite and notifications"""
     
+    # Class-level: set once the table and its migrations are in place
+    _db_ready = False
+    
     def __init__(self):
         self.db_path = RIN_DIR / "rin.db"
-        self.tasks = {}  # Track running asyncio tasks
-        self.tts = TTSInterface.create()
+        # One dispatcher task sleeps until the earliest due time on the heap of
+        # (due timestamp, seq, id); _scheduled holds the reminders still pending,
+        # so a cancelled one is simply skipped when it reaches the top
+        self._heap = []
+        self._scheduled = {}
+        self._seq = itertools.count()
+        self._wakeup = None
+        self._dispatcher = None
+        self._notifying = set()  # notification tasks in flight, so the dispatcher never waits on TTS
+        self._tts = None
+        self._loaded = False
+        self._db = SharedConnection(self.db_path, row_factory=aiosqlite.Row)  # rows become reminder dicts
         logger.info(f"Reminder Manager initialized, using DB at {self.db_path}")
         
-        # Load existing reminders asynchronously in the background
-        asyncio.create_task(self._load_reminders())
+        # Load existing reminders in the background if a loop is running;
+        # otherwise (e.g. built by a CLI command) the first async call loads them
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            self._loaded = True
+            asyncio.create_task(self._load_reminders())
+    
+    @property
+    def tts(self):
+        """Create the TTS engine on first notification rather than at construction"""
+        if self._tts is None:
+            from rin.tts import TTSInterface
+            self._tts = TTSInterface.create()
+        return self._tts
+    
+    async def aclose(self):
+        """Stop the scheduled and in-flight notifications and close the shared connection
+        
+        Reminders stay in the database and are rescheduled by the next manager.
+        Until the connection is closed its worker thread blocks interpreter exit.
+        """
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
+        # Bound to this loop; the next schedule (maybe on a new loop) makes its own
+        self._wakeup = None
+        for task in self._notifying:
+            task.cancel()
+        await asyncio.gather(*self._notifying, return_exceptions=True)
+        if self._tts is not None:
+            await self._tts.aclose()
+        await self._db.aclose()
+    
+    async def prewarm(self):
+        """Open the connection and schedule persisted reminders ahead of the first command"""
+        await self._ensure_loaded()
+    
+    async def _ensure_loaded(self):
+        """Load persisted reminders once if construction couldn't schedule it"""
+        if not self._loaded:
+            self._loaded = True
+            await self._load_reminders()
     
     async def _init_db(self):
-        """Ensure the reminders table exists"""
-        async with aiosqlite.connect(self.db_path) as db:
+        """Ensure the reminders table exists (the DDL runs once per process)"""
+        if self._db_ready:
+            return
+        async with self._db.acquire() as db:
+            # The background load and the first call can both get here; the
+            # connection lock lets only the first run the DDL
+            if self._db_ready:
+                return
             await db.execute('''
                 CREATE TABLE IF NOT EXISTS reminders (
                     id TEXT PRIMARY KEY, -- Use string ID for simplicity
                     type TEXT NOT NULL, -- 'timer' or 'reminder'
                     description TEXT NOT NULL,
                     created_at TEXT NOT NULL,
-                    due_time TEXT NOT NULL,
+                    due_time TEXT NOT NULL, -- ISO form, for display
+                    due_time_ms INTEGER NOT NULL, -- epoch ms, for comparisons and scheduling
                     duration_seconds INTEGER, -- Only for timers
                     completed INTEGER DEFAULT 0
                 )
             ''')
-            await db.execute('CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders (due_time)')
+            cursor = await db.execute('PRAGMA table_info(reminders)')
+            if 'due_time_ms' not in {row['name'] for row in await cursor.fetchall()}:
+                await self._migrate_due_time_ms(db)
+            await self._backfill_due_time_ms(db)
+            # Every query reads pending reminders only; the partial index covers
+            # them and replaces the earlier full index on due_time
+            await db.executescript('''
+                CREATE INDEX IF NOT EXISTS idx_reminders_pending ON reminders (due_time_ms) WHERE completed = 0;
+                DROP INDEX IF EXISTS idx_reminders_due;
+            ''')
             await db.commit()
+        type(self)._db_ready = True
 
+    async def _migrate_due_time_ms(self, db):
+        """Add due_time_ms to an older table; _backfill_due_time_ms fills it in"""
+        await db.executescript('''
+            ALTER TABLE reminders ADD COLUMN due_time_ms INTEGER NOT NULL DEFAULT 0;
+            DROP INDEX IF EXISTS idx_reminders_pending; -- was on the ISO column
+        ''')
+    
+    async def _backfill_due_time_ms(self, db):
+        """Fill due_time_ms from the ISO due_time wherever it still holds the column's 0 default"""
+        # The ALTER above commits on its own, so this runs on every first init:
+        # an interrupted backfill then finishes instead of leaving every
+        # reminder looking past-due to _load_reminders
+        cursor = await db.execute('SELECT id, due_time FROM reminders WHERE due_time_ms = 0')
+        rows = await cursor.fetchall()
+        updates = []
+        for row in rows:
+            try:
+                updates.append((_epoch_ms(_parse_due(row['due_time'])), row['id']))
+            except (TypeError, ValueError):
+                logger.error(f"Invalid due_time for reminder {row['id']}, leaving it unscheduled")
+        if updates:
+            await db.executemany('UPDATE reminders SET due_time_ms = ? WHERE id = ?', updates)
+            logger.info(f"Backfilled due_time_ms for {len(updates)} reminders")
+    
     async def _load_reminders(self):
         """Load persisted reminders and schedule them"""
         await self._init_db()
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute('SELECT * FROM reminders WHERE completed = 0')
-                reminders = await cursor.fetchall()
-            
-            now = datetime.datetime.now()
-            active_count = 0
-            for row in reminders:
-                reminder = dict(zip([c[0] for c in cursor.description], row))
-                due_time = datetime.datetime.fromisoformat(reminder["due_time"])
-                if due_time > now:
-                    self._schedule_reminder(reminder)
-                    active_count += 1
-                else:
-                    # Mark past-due reminders as completed
-                    await self._mark_completed(reminder["id"])
+            now = int(time.time() * 1000)
+            async with self._db.acquire() as db:
+                # Past-due reminders are completed in one statement, the rest scheduled
+                cursor = await db.execute(
+                    'UPDATE reminders SET completed = 1 WHERE completed = 0 AND due_time_ms <= ?',
+                    (now,)
+                )
+                if cursor.rowcount:
+                    logger.info(f"Marked {cursor.rowcount} past-due reminders as completed")
+                await db.commit()
+                cursor = await db.execute(
+                    '''SELECT id, type, description, due_time, due_time_ms, duration_seconds
+                       FROM reminders WHERE completed = 0 AND due_time_ms > ? ORDER BY due_time_ms''',
+                    (now,)
+                )
+                rows = await cursor.fetchall()
             
-            logger.info(f"Loaded and scheduled {active_count} active reminders")
+            for row in rows:
+                self._schedule_reminder(self._row_to_reminder(row))
+            logger.info(f"Loaded and scheduled {len(rows)} active reminders")
         except Exception as e:
             logger.error(f"Error loading reminders: {str(e)}")
 
+    @staticmethod
+    def _row_to_reminder(row):
+        """Build a reminder dict from a DB row, parsing due_time once into '_due_dt'"""
+        reminder = dict(row)
+        reminder["_due_dt"] = _parse_due(reminder["due_time"])
+        return reminder
+    
     async def get_reminders(self):
         """Get all active, non-completed reminders"""
+        await self._ensure_loaded()
         await self._init_db()
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._db.acquire() as db:
                 cursor = await db.execute(
-                    'SELECT * FROM reminders WHERE completed = 0 ORDER BY due_time ASC'
+                    'SELECT * FROM reminders WHERE completed = 0 ORDER BY due_time_ms ASC'
                 )
                 rows = await cursor.fetchall()
-                return [dict(zip([c[0] for c in cursor.description], row)) for row in rows]
+                return [self._row_to_reminder(row) for row in rows]
         except Exception as e:
             logger.error(f"Error getting reminders: {str(e)}")
             return []
     
     async def set_timer(self, duration_seconds, description="Timer"):
         """Set a simple timer"""
+        await self._ensure_loaded()
         await self._init_db()
         now = datetime.datetime.now()
         due_time = now + datetime.timedelta(seconds=duration_seconds)
@@ -92,20 +287,18 @@ class ReminderManager:
             "description": description,
             "created_at": now.isoformat(),
             "due_time": due_time.isoformat(),
+            "due_time_ms": _epoch_ms(due_time),
             "duration_seconds": duration_seconds,
-            "completed": 0
+            "completed": 0,
+            "_due_dt": due_time
         }
         
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    'INSERT INTO reminders (id, type, description, created_at, due_time, duration_seconds, completed) VALUES (?, ?, ?, ?, ?, ?, ?)',
-                    (reminder["id"], reminder["type"], reminder["description"], reminder["created_at"], 
-                     reminder["due_time"], reminder["duration_seconds"], reminder["completed"])
-                )
+            async with self._db.acquire() as db:
+                await db.execute(_INSERT_SQL, reminder)
                 await db.commit()
             self._schedule_reminder(reminder)
-            logger.info(f"Timer set: {description} (ID: {reminder_id})")
+            logger.info("Timer set: %s (ID: %s)", description, reminder_id)
             return reminder
         except Exception as e:
              logger.error(f"Error setting timer: {str(e)}")
@@ -113,9 +306,11 @@ class ReminderManager:
 
     async def set_reminder(self, due_time_iso, description):
         """Set a reminder for a specific time"""
+        await self._ensure_loaded()
         await self._init_db()
         now = datetime.datetime.now()
         reminder_id = f"reminder_{int(time.time())}"
+        due_dt = datetime.datetime.fromisoformat(due_time_iso)
         
         reminder = {
             "id": reminder_id,
@@ -123,20 +318,18 @@ class ReminderManager:
             "description": description,
             "created_at": now.isoformat(),
             "due_time": due_time_iso,
+            "due_time_ms": _epoch_ms(due_dt),
             "duration_seconds": None,
-            "completed": 0
+            "completed": 0,
+            "_due_dt": due_dt
         }
         
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    'INSERT INTO reminders (id, type, description, created_at, due_time, completed) VALUES (?, ?, ?, ?, ?, ?)',
-                    (reminder["id"], reminder["type"], reminder["description"], 
-                     reminder["created_at"], reminder["due_time"], reminder["completed"])
-                )
+            async with self._db.acquire() as db:
+                await db.execute(_INSERT_SQL, reminder)
                 await db.commit()
             self._schedule_reminder(reminder)
-            logger.info(f"Reminder set: {description} (ID: {reminder_id})")
+            logger.info("Reminder set: %s (ID: %s)", description, reminder_id)
             return reminder
         except Exception as e:
              logger.error(f"Error setting reminder: {str(e)}")
@@ -144,13 +337,12 @@ class ReminderManager:
 
     async def cancel_reminder(self, reminder_id):
         """Cancel an active reminder by marking completed"""
+        await self._ensure_loaded()
         success = await self._mark_completed(reminder_id)
         if success:
-            # Cancel the task if it's running
-            if reminder_id in self.tasks:
-                self.tasks[reminder_id].cancel()
-                del self.tasks[reminder_id]
-                logger.info(f"Cancelled reminder task {reminder_id}")
+            # Unschedule it; the dispatcher skips its heap entry
+            if self._scheduled.pop(reminder_id, None) is not None:
+                logger.info("Cancelled reminder task %s", reminder_id)
             return True
         else:
             logger.warning(f"Reminder {reminder_id} not found for cancellation")
@@ -160,14 +352,11 @@ class ReminderManager:
         """Mark a reminder as completed in the database"""
         await self._init_db()
         try:
-             async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    'UPDATE reminders SET completed = 1 WHERE id = ? AND completed = 0',
-                    (reminder_id,)
-                )
+             async with self._db.acquire() as db:
+                cursor = await db.execute(_MARK_COMPLETED_SQL, (reminder_id,))
                 await db.commit()
                 if cursor.rowcount > 0:
-                     logger.info(f"Marked reminder {reminder_id} as completed")
+                     logger.info("Marked reminder %s as completed", reminder_id)
                      return True
                 return False
         except Exception as e:
@@ -175,11 +364,9 @@ class ReminderManager:
              return False
 
     def _schedule_reminder(self, reminder):
-        """Create an asyncio task for the reminder"""
-        due_time = datetime.datetime.fromisoformat(reminder["due_time"])
-        now = datetime.datetime.now()
-        
-        seconds_until_due = (due_time - now).total_seconds()
+        """Queue the reminder for the dispatcher task"""
+        due_ts = reminder["due_time_ms"] / 1000
+        seconds_until_due = due_ts - time.time()
         if seconds_until_due <= 0:
             logger.warning(f"Attempted to schedule past-due reminder {reminder['id']}")
             # Mark as completed immediately if needed
@@ -187,26 +374,55 @@ class ReminderManager:
             return
         
         reminder_id = reminder["id"]
-        if reminder_id in self.tasks and not self.tasks[reminder_id].done():
-            logger.info(f"Reminder task {reminder_id} already scheduled.")
+        if reminder_id in self._scheduled:
+            logger.info("Reminder task %s already scheduled.", reminder_id)
             return
-            
-        task = asyncio.create_task(self._notify_at_time(reminder, seconds_until_due))
-        self.tasks[reminder_id] = task
-        logger.info(f"Scheduled task for reminder {reminder_id} in {seconds_until_due:.1f}s")
+        
+        self._scheduled[reminder_id] = reminder
+        heapq.heappush(self._heap, (due_ts, next(self._seq), reminder_id))
+        # Created lazily: on Python 3.9 an Event binds to the loop current at creation
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        # The new reminder may be due before the one the dispatcher sleeps on
+        self._wakeup.set()
+        logger.info("Scheduled task for reminder %s in %.1fs", reminder_id, seconds_until_due)
 
-    async def _notify_at_time(self, reminder, delay_seconds):
-        """Wait for the specified time and send notification"""
+    async def _dispatch(self):
+        """Fire reminders in due order, sleeping until the earliest or a new schedule"""
         try:
-            await asyncio.sleep(delay_seconds)
-            
-            # Double-check if it was cancelled or completed while sleeping
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute('SELECT completed FROM reminders WHERE id = ?', (reminder["id"],))
-                row = await cursor.fetchone()
-                if not row or row[0] == 1:
-                    logger.info(f"Reminder {reminder['id']} was completed/cancelled before notification.")
-                    return
+            while True:
+                self._wakeup.clear()
+                # Drop cancelled reminders from the top of the heap
+                while self._heap and self._heap[0][2] not in self._scheduled:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    await self._wakeup.wait()
+                    continue
+                delay = self._heap[0][0] - time.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                _, _, reminder_id = heapq.heappop(self._heap)
+                task = asyncio.create_task(self._notify(self._scheduled.pop(reminder_id)))
+                self._notifying.add(task)
+                task.add_done_callback(self._notifying.discard)
+        except asyncio.CancelledError:
+            logger.info(f"Reminder dispatcher stopped with {len(self._scheduled)} reminders pending")
+            raise
+
+    async def _notify(self, reminder):
+        """Send a due reminder's notification unless it was completed or cancelled meanwhile"""
+        try:
+            # Marking it completed is also the check: another process (e.g. a CLI
+            # cancel) may have completed it while this one waited
+            if not await self._mark_completed(reminder["id"]):
+                logger.info("Reminder %s was completed/cancelled before notification.", reminder['id'])
+                return
 
             # Send notification
             desc = reminder["description"]
@@ -216,24 +432,21 @@ class ReminderManager:
                 message = f"Reminder: {desc}"
             
             await self._show_notification("Rin Assistant", message)
-            
-            # Mark as completed in DB
-            await self._mark_completed(reminder["id"])
-            
-        except asyncio.CancelledError:
-            logger.info(f"Reminder task {reminder['id']} was cancelled")
         except Exception as e:
-            logger.error(f"Error in reminder notification task {reminder['id']}: {str(e)}", exc_info=True)
-            # Attempt to mark as completed even on error to prevent re-notification
-            await self._mark_completed(reminder["id"])
-        finally:
-            # Clean up task reference
-            if reminder["id"] in self.tasks:
-                del self.tasks[reminder["id"]]
+            logger.error(f"Error in reminder notification {reminder['id']}: {str(e)}", exc_info=True)
 
     async def _show_notification(self, title, message):
         """Show notification using console and TTS"""
-        logger.info(f"Notification: {message}")
+        logger.info("Notification: %s", message)
+        
+        # System notification - using console for now instead of Plyer
+        # In a full implementation, we would use Plyer's notification system
+        try:
+            # Print the visible console notification first: it needs nothing from
+            # the TTS call, which can take a network round-trip
+            print(f"\n{'='*50}\n📢 NOTIFICATION: {title}\n📝 {message}\n{'='*50}\n")
+        except Exception as e:
+            logger.error(f"Error showing console notification: {str(e)}")
         
         # Generate speech notification
         audio_path = None
@@ -242,18 +455,7 @@ class ReminderManager:
         except Exception as e:
             logger.error(f"Error generating audio notification: {str(e)}")
         
-        # System notification - using console for now instead of Plyer
-        # In a full implementation, we would use Plyer's notification system
-        try:
-            # Print a visible console notification
-            print(f"\n{'='*50}")
-            print(f"📢 NOTIFICATION: {title}")
-            print(f"📝 {message}")
-            print(f"{'='*50}\n")
-        except Exception as e:
-            logger.error(f"Error showing console notification: {str(e)}")
-            
-        # Play sound *after* showing notification
+        # Play sound once it is ready
         if audio_path:
             await self._play_notification_sound(audio_path)
 
@@ -261,7 +463,7 @@ class ReminderManager:
         """Play notification sound - simplified for this implementation"""
         # In a full implementation, we would use sounddevice or another audio library
         try:
-            logger.info(f"🔊 Playing notification sound: {audio_path}")
+            logger.info("🔊 Playing notification sound: %s", audio_path)
             # For now, just log the audio path
             # In a full implementation, this would use sounddevice or similar
         except Exception as e:
@@ -1,15 +1,64 @@
 import os
-import json
+import time
+import asyncio
+import hashlib
 import aiohttp
 import logging
 import urllib.parse
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from rin.config import RIN_DIR
+from rin.config import RIN_DIR, SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL
 from rin.logging_config import loggers
 from rin.llm import LLMInterface
 
 logger = loggers.get('core', logging.getLogger('rin.search'))
 
+# Summary batching: requests arriving within _SUMMARY_BATCH_WINDOW seconds of the
+# first one (up to _SUMMARY_BATCH_MAX) share a single LLM call
+_SUMMARY_BATCH_WINDOW = 0.02
+_SUMMARY_BATCH_MAX = 8
+
+class _TTLCache:
+    """LRU of recent results that expire after SEARCH_CACHE_TTL seconds.
+    
+    Concurrent misses for one key share a single computation; failed or
+    cancelled computations, and results rejected by `cacheable`, aren't kept.
+    """
+    
+    def __init__(self, maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._inflight = {}
+    
+    async def get_or_compute(self, key, compute, cacheable=lambda value: True):
+        """Return the cached value for key, else await compute() and cache it"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._store(key, t, cacheable))
+        # Shield so one cancelled caller doesn't cancel the work for the others
+        return await asyncio.shield(task)
+    
+    def _store(self, key, task, cacheable):
+        """Cache a finished computation's result if it succeeded and is cacheable"""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None or not cacheable(task.result()):
+            return
+        self._entries[key] = (task.result(), time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
 # --- Search Provider Abstraction ---
 
 class SearchProvider(ABC):
@@ -19,41 +68,69 @@ class SearchProvider(ABC):
         """Perform search and return structured results or error dict."""
         pass
 
+    async def aclose(self):
+        """Release network resources (no-op unless a provider holds any)."""
+        pass
+
 class SerpAPISearch(SearchProvider):
     """Search provider using SerpAPI."""
     def __init__(self):
         self.api_key = os.getenv("SERPAPI_KEY")
         if not self.api_key:
             raise ValueError("SERPAPI_KEY not found in environment variables.")
+        self._session = None
+        self._cache = _TTLCache()
         logger.info("Initialized SerpAPISearch provider.")
 
+    async def _get_session(self):
+        """Return the shared session, so later searches reuse its warm TLS connections."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the shared session."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
     async def search(self, query, num_results=5):
+        """Search SerpAPI, reusing results for a repeated query; errors aren't cached."""
+        return await self._cache.get_or_compute(
+            (query, num_results),
+            lambda: self._search(query, num_results),
+            cacheable=lambda result: "error" not in result
+        )
+
+    async def _search(self, query, num_results):
         encoded_query = urllib.parse.quote(query)
         url = f"https://serpapi.com/search.json?q={encoded_query}&num={num_results}&api_key={self.api_key}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Error from SerpAPI ({response.status}): {error_text}")
-                        return {"error": f"Search API error: {response.status}"}
-                    
-                    data = await response.json()
-                    
-                    # Basic result parsing
-                    if "organic_results" not in data or not data["organic_results"]:
-                        return {"results": []} # Return empty list if no organic results
-                        
-                    results = []
-                    for res in data["organic_results"][:num_results]:
-                         results.append({
-                            "title": res.get("title", "No title"),
-                            "link": res.get("link", "#"),
-                            "snippet": res.get("snippet", "No description available.")
-                        })
-                    return {"results": results}
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Error from SerpAPI ({response.status}): {error_text}")
+                    return {"error": f"Search API error: {response.status}"}
+                
+                data = await response.json()
+                
+                # Basic result parsing
+                if "organic_results" not in data or not data["organic_results"]:
+                    return {"results": []} # Return empty list if no organic results
                     
+                results = []
+                for res in data["organic_results"][:num_results]:
+                     results.append({
+                        "title": res.get("title", "No title"),
+                        "link": res.get("link", "#"),
+                        "snippet": res.get("snippet", "No description available.")
+                    })
+                return {"results": results}
+                
         except Exception as e:
             logger.error(f"Error during SerpAPI search: {str(e)}", exc_info=True)
             return {"error": f"Failed to execute search: {str(e)}"}
@@ -85,6 +162,116 @@ def create_search_provider() -> SearchProvider:
         logger.warning(f"Unknown SEARCH_PROVIDER '{provider_name}'. Using placeholder.")
         return PlaceholderSearch()
 
+# --- Summarization ---
+
+def _summary_prompt(query, search_context):
+    """Prompt asking the LLM to summarize one query's search results."""
+    return f"""Please provide a concise summary of these search results for the query \"{query}\". 
+            Focus on extracting the most relevant information that answers the query.
+            If the results don't seem to address the query well, mention that.
+            
+            {search_context}
+            
+            Summary:"""
+
+class BatchingSummarizer:
+    """Summarize search results, folding concurrent requests into one LLM call."""
+    
+    def __init__(self, llm):
+        self.llm = llm
+        self._queue = None
+        self._worker = None
+        self._batches = set()  # batch LLM calls in flight
+        self._cache = _TTLCache()
+    
+    async def summarize(self, query, search_context):
+        """Return the LLM summary for one query's formatted results."""
+        # The context includes the query, so it alone identifies the summary
+        key = hashlib.sha1(search_context.encode("utf-8")).digest()
+        return await self._cache.get_or_compute(key, lambda: self._summarize(query, search_context))
+    
+    async def _summarize(self, query, search_context):
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.ensure_future(self._run())
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((query, search_context, future))
+        return await future
+    
+    async def aclose(self):
+        """Stop the background worker and its in-flight batches."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        for task in self._batches:
+            task.cancel()
+        await asyncio.gather(*self._batches, return_exceptions=True)
+    
+    async def _run(self):
+        """Collect requests into batches, each sent as its own task so the next keeps collecting."""
+        queue = self._queue
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _SUMMARY_BATCH_WINDOW
+            while len(batch) < _SUMMARY_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Callers that gave up (cancelled) don't need a summary
+            batch = [item for item in batch if not item[2].done()]
+            if batch:
+                task = asyncio.ensure_future(self._deliver(batch))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+    
+    async def _deliver(self, batch):
+        """Summarize one batch and resolve its callers' futures."""
+        try:
+            summaries = await self._summarize_batch(batch)
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), summary in zip(batch, summaries):
+            if not future.done():
+                future.set_result(summary)
+    
+    async def _summarize_batch(self, batch):
+        """Summaries for each (query, context, future) in batch, in order."""
+        if len(batch) == 1:
+            query, search_context, _ = batch[0]
+            return [await self.llm.generate_response(_summary_prompt(query, search_context))]
+        
+        blocks = "\n".join(
+            f"=== Block {i+1}: query \"{query}\" ===\n{search_context}"
+            for i, (query, search_context, _) in enumerate(batch)
+        )
+        prompt = f"""Please provide a concise summary of each of the following {len(batch)} blocks
+            of search results, each for its own query. Focus on extracting the most relevant
+            information that answers that block's query; if its results don't seem to address
+            the query well, mention that.
+            Respond with only a JSON array of {len(batch)} strings, one summary per block, in order.
+            
+            {blocks}"""
+        
+        return await self.llm.generate_batch(
+            prompt, len(batch), str,
+            lambda i: self.llm.generate_response(_summary_prompt(batch[i][0], batch[i][1])),
+            what="summaries",
+        )
+
 # --- Web Search Manager ---
 
 class WebSearchManager:
@@ -93,13 +280,26 @@ class WebSearchManager:
     def __init__(self):
         self.search_provider = create_search_provider()
         self.llm = LLMInterface.create() # Assuming LLMInterface factory exists
+        self.summarizer = BatchingSummarizer(self.llm)
+        self._llm_warm = False
         logger.info(f"Web Search Manager initialized with provider: {self.search_provider.__class__.__name__}")
     
+    async def aclose(self):
+        """Close the search provider's connections and stop the summarizer."""
+        await self.summarizer.aclose()
+        await self.search_provider.aclose()
+    
     async def search_and_summarize(self, query, num_results=5):
         """Search the web using the configured provider and summarize results."""
         try:
             # Perform the search using the provider
-            search_result = await self.search_provider.search(query, num_results)
+            search = self.search_provider.search(query, num_results)
+            if self._llm_warm:
+                search_result = await search
+            else:
+                # First search: open the LLM connection while the search is in flight
+                self._llm_warm = True
+                search_result, _ = await asyncio.gather(search, self.llm.prewarm())
             
             if "error" in search_result:
                 return {"error": search_result["error"]}
@@ -109,22 +309,15 @@ class WebSearchManager:
                  return {"summary": "I couldn't find any relevant web results for that query.", "results": []}
             
             # Format results for LLM summarization
-            search_context = f"Search query: {query}\n\nTop {len(results_list)} results:\n"
-            for i, result in enumerate(results_list):
-                search_context += f"{i+1}. {result['title']}\n"
-                search_context += f"   URL: {result['link']}\n"
-                search_context += f"   Snippet: {result['snippet']}\n\n"
-            
-            # Generate a summary using the LLM
-            prompt = f"""Please provide a concise summary of these search results for the query \"{query}\". 
-            Focus on extracting the most relevant information that answers the query.
-            If the results don't seem to address the query well, mention that.
-            
-            {search_context}
-            
-            Summary:"""
+            search_context = f"Search query: {query}\n\nTop {len(results_list)} results:\n" + "".join(
+                f"{i+1}. {result['title']}\n"
+                f"   URL: {result['link']}\n"
+                f"   Snippet: {result['snippet']}\n\n"
+                for i, result in enumerate(results_list)
+            )
             
-            summary = await self.llm.generate_response(prompt)
+            # Generate a summary using the LLM (shared with concurrent searches)
+            summary = await self.summarizer.summarize(query, search_context)
             
             return {
                 "query": query,
@@ -1,42 +1,136 @@
 import sqlite3
 import asyncio
+import contextlib
 import logging
+import aiosqlite
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rin.config import RIN_DIR
 from rin.logging_config import loggers
 
 logger = loggers['storage']
 
+# Interaction write batching: rows enqueued within _BATCH_WINDOW seconds of the
+# first one (up to _BATCH_MAX) are written in a single transaction
+_BATCH_WINDOW = 0.005
+_BATCH_MAX = 64
+_QUEUE_MAX = 256
+
+# Run once at open on every connection to rin.db (Storage's and the managers').
+# WAL lets reads proceed during a write and makes synchronous=NORMAL safe
+# (commits append to the WAL without an fsync each); temp tables stay in memory,
+# a 128MB mmap serves reads without read() syscalls and the page cache may grow
+# to 64MB. Storage and three managers share the file, so a writer waits up to 5s
+# for another's lock instead of failing with "database is locked".
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=134217728;
+PRAGMA cache_size=-64000;
+PRAGMA busy_timeout=5000;
+"""
+
+class SharedConnection:
+    """A manager's long-lived aiosqlite connection, used by one operation at a time"""
+    
+    def __init__(self, path, row_factory=None):
+        self.path = path
+        self.row_factory = row_factory
+        self._conn = None  # opened by the first acquire()
+        # Created lazily: on Python 3.9 a Lock binds to the loop current at creation
+        self._lock = None
+    
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        """Yield the connection, opening it on first use"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._conn is None:
+                self._conn = await aiosqlite.connect(self.path)
+                if self.row_factory is not None:
+                    self._conn.row_factory = self.row_factory
+                await self._conn.executescript(CONNECTION_PRAGMAS)
+            try:
+                yield self._conn
+            finally:
+                # Like closing a per-call connection: drop anything left uncommitted
+                if self._conn.in_transaction:
+                    await self._conn.rollback()
+    
+    async def aclose(self):
+        """Close the connection; until then its worker thread blocks interpreter exit"""
+        if self._conn is not None:
+            async with self._lock:
+                conn, self._conn = self._conn, None
+                await conn.execute("PRAGMA optimize")
+                await conn.close()
+        # The next acquire() may run on a new loop (the CLI's, after close_loop)
+        self._lock = None
+
 class Storage:
     """Database storage with async support"""
     
     def __init__(self):
         self.path = RIN_DIR / "rin.db"
+        self._queue = None
+        self._writer = None
+        # One long-lived connection, only ever touched from this one thread
+        # (sqlite3 connections are bound to the thread that opened them)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rin-storage")
+        self._conn = None
         # Initialize synchronously
         self._init_db()
         logger.info(f"Storage initialized at {self.path}")
     
+    def _connect(self):
+        """Open a connection with CONNECTION_PRAGMAS applied"""
+        conn = sqlite3.connect(self.path)
+        conn.executescript(CONNECTION_PRAGMAS)
+        return conn
+    
+    def _db(self):
+        """Return the shared connection, opening it on first use (executor thread only)"""
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+    
+    def _close_sync(self):
+        """Close the shared connection (to be run in executor)"""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            conn.execute("PRAGMA optimize")
+            conn.close()
+    
     def _init_db(self):
         """Initialize database schema"""
-        conn = sqlite3.connect(self.path)
+        conn = self._connect()
         conn.execute('''CREATE TABLE IF NOT EXISTS interactions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             query TEXT,
             response TEXT,
             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
         )''')
+        conn.execute('''CREATE TABLE IF NOT EXISTS response_cache (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            ts INTEGER NOT NULL
+        )''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_response_cache_ts ON response_cache (ts)')
         conn.commit()
         conn.close()
     
     async def save_interaction(self, query, response):
         """Save interaction to database asynchronously"""
         try:
-            logger.debug(f"Saving interaction: Q: {query[:50]}... R: {response[:50]}...")
+            logger.debug("Saving interaction: Q: %.50s... R: %.50s...", query, response)
             
             # Run in executor to avoid blocking
             loop = asyncio.get_event_loop()
             await loop.run_in_executor(
-                None,
+                self._executor,
                 self._save_interaction_sync,
                 query,
                 response
@@ -48,23 +142,79 @@ class Storage:
     
     def _save_interaction_sync(self, query, response):
         """Synchronous database save (to be run in executor)"""
-        conn = sqlite3.connect(self.path)
-        conn.execute(
-            "INSERT INTO interactions (query, response) VALUES (?, ?)", 
-            (query, response)
-        )
-        conn.commit()
-        conn.close()
+        with self._db() as conn:
+            conn.execute(
+                "INSERT INTO interactions (query, response) VALUES (?, ?)", 
+                (query, response)
+            )
+    
+    async def enqueue_interaction(self, query, response):
+        """Queue an interaction for the batched background writer"""
+        if self._writer is None or self._writer.done():
+            self._queue = asyncio.Queue(maxsize=_QUEUE_MAX)
+            self._writer = asyncio.ensure_future(self._write_batches())
+        # Waits only when _QUEUE_MAX rows are already pending
+        await self._queue.put((query, response))
+    
+    async def _write_batches(self):
+        """Drain queued interactions and write each batch in one transaction"""
+        queue = self._queue
+        loop = asyncio.get_event_loop()
+        while True:
+            rows = [await queue.get()]
+            deadline = loop.time() + _BATCH_WINDOW
+            while len(rows) < _BATCH_MAX:
+                if not queue.empty():
+                    rows.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                logger.debug("Saving batch of %s interactions", len(rows))
+                await loop.run_in_executor(self._executor, self._save_interactions_sync, rows)
+            except Exception as e:
+                logger.error(f"Error saving interactions: {str(e)}", exc_info=True)
+            finally:
+                for _ in rows:
+                    queue.task_done()
+    
+    def _save_interactions_sync(self, rows):
+        """Synchronous batch insert (to be run in executor)"""
+        with self._db() as conn:
+            conn.executemany(
+                "INSERT INTO interactions (query, response) VALUES (?, ?)",
+                rows
+            )
+    
+    async def prewarm(self):
+        """Open the shared connection ahead of the first cache lookup"""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._executor, self._db)
+    
+    async def aclose(self):
+        """Flush queued interactions, stop the background writer and close the connection"""
+        if self._writer is not None:
+            if not self._writer.done():
+                await self._queue.join()
+                self._writer.cancel()
+            self._writer = None
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._executor, self._close_sync)
     
     async def get_interactions(self, limit=10):
         """Get recent interactions asynchronously"""
         try:
-            logger.debug(f"Retrieving {limit} recent interactions")
+            logger.debug("Retrieving %s recent interactions", limit)
             
             # Run in executor to avoid blocking
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
-                None,
+                self._executor,
                 self._get_interactions_sync,
                 limit
             )
@@ -75,12 +225,56 @@ class Storage:
     
     def _get_interactions_sync(self, limit):
         """Synchronous database query (to be run in executor)"""
-        conn = sqlite3.connect(self.path)
-        cursor = conn.cursor()
-        cursor.execute(
+        cursor = self._db().execute(
             "SELECT query, response FROM interactions ORDER BY timestamp DESC LIMIT ?", 
             (limit,)
         )
-        result = [dict(query=row[0], response=row[1]) for row in cursor.fetchall()]
-        conn.close()
-        return result
+        return [dict(query=row[0], response=row[1]) for row in cursor.fetchall()]
+    
+    async def get_cached_response(self, key, max_age):
+        """Get a persisted LLM response no older than max_age seconds, or None"""
+        try:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self._get_cached_response_sync,
+                key,
+                max_age
+            )
+        except Exception as e:
+            logger.error(f"Error reading response cache: {str(e)}", exc_info=True)
+            return None
+    
+    def _get_cached_response_sync(self, key, max_age):
+        """Synchronous cache lookup (to be run in executor)"""
+        row = self._db().execute(
+            "SELECT response FROM response_cache WHERE key = ? AND ts >= ?",
+            (key, int(time.time()) - max_age)
+        ).fetchone()
+        return row[0] if row else None
+    
+    async def set_cached_response(self, key, response, max_age):
+        """Persist an LLM response and sweep entries older than max_age seconds"""
+        try:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                self._executor,
+                self._set_cached_response_sync,
+                key,
+                response,
+                max_age
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error writing response cache: {str(e)}", exc_info=True)
+            return False
+    
+    def _set_cached_response_sync(self, key, response, max_age):
+        """Synchronous cache write (to be run in executor)"""
+        now = int(time.time())
+        with self._db() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, now)
+            )
+            conn.execute("DELETE FROM response_cache WHERE ts < ?", (now - max_age,))
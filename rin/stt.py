@@ -3,18 +3,30 @@ import asyncio
 import logging
 from abc import ABC, abstractmethod
 from rin.audio import AudioHandler
-from rin.config import WHISPER_MODEL
+from rin.config import WHISPER_MODEL, WHISPER_COMPUTE_TYPE
 from rin.logging_config import loggers
 
 logger = loggers['stt']
 
-# Try to import whisper, but don't fail if it's not available
+# Whisper models expect 16 kHz mono float32 samples
+WHISPER_SAMPLE_RATE = 16000
+
+# Prefer faster-whisper (CTranslate2, int8 on CPU by default), then OpenAI's
+# reference whisper package; don't fail if neither is available
+whisper = None
 try:
-    import whisper
-    WHISPER_AVAILABLE = True
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
 except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+    # Only needed as the fallback; importing it pulls in torch
+    try:
+        import whisper
+    except ImportError:
+        pass
+WHISPER_AVAILABLE = FASTER_WHISPER_AVAILABLE or whisper is not None
+if not WHISPER_AVAILABLE:
     logger.warning("Whisper package not found. Speech-to-text functionality will be limited.")
-    WHISPER_AVAILABLE = False
 
 class STTInterface(ABC):
     """Abstract base class for STT engines"""
@@ -24,7 +36,7 @@ class STTInterface(ABC):
         """Factory method to create appropriate STT engine"""
         if engine == "whisper":
             if not WHISPER_AVAILABLE:
-                logger.error("Whisper engine requested but package is not installed. Try 'pip install openai-whisper'")
+                logger.error("Whisper engine requested but package is not installed. Try 'pip install faster-whisper'")
                 raise ImportError("Whisper package not installed")
             return WhisperSTT()
         elif engine == "google":
@@ -45,47 +57,101 @@ class STTInterface(ABC):
     async def transcribe_from_mic(self, duration=5):
         """Record from microphone and transcribe"""
         pass
+    
+    async def prewarm(self):
+        """Load models ahead of first use (no-op unless an engine overrides it)"""
+        pass
 
 class WhisperSTT(STTInterface):
+    # Loaded models are shared by every instance, keyed by model name: one can be gigabytes
+    _models = {}
+    _model_loads = {}  # Shared load futures so concurrent callers load once
+    
     def __init__(self):
         if not WHISPER_AVAILABLE:
             raise ImportError("Whisper package not available")
             
-        logger.info(f"Loading Whisper model: {WHISPER_MODEL}")
         # Don't load the model in the constructor - load it on first use
         # This avoids event loop issues
-        self._model = None
         self._model_name = WHISPER_MODEL
         logger.info("Whisper STT initialized")
     
     async def _ensure_model_loaded(self):
-        """Load the model if not already loaded"""
-        if self._model is None:
-            logger.info(f"Loading Whisper model: {self._model_name}")
-            # Get the current event loop and load the model in it
-            loop = asyncio.get_running_loop()
-            self._model = await loop.run_in_executor(
-                None, 
-                lambda: whisper.load_model(self._model_name)
-            )
+        """Load the model if no instance has loaded it yet"""
+        name = self._model_name
+        model = self._models.get(name)
+        if model is None:
+            load = self._model_loads.get(name)
+            if load is None:
+                logger.info(f"Loading Whisper model: {name}")
+                loop = asyncio.get_running_loop()
+                load = self._model_loads[name] = loop.run_in_executor(None, self._load_model)
+            try:
+                model = await load
+            finally:
+                self._model_loads.pop(name, None)
+            self._models[name] = model
             logger.info("Whisper model loaded successfully")
-        return self._model
+        return model
+    
+    def _load_model(self):
+        """Load the model with whichever backend is installed (run in executor)"""
+        if FASTER_WHISPER_AVAILABLE:
+            return WhisperModel(self._model_name, device="auto", compute_type=WHISPER_COMPUTE_TYPE)
+        return whisper.load_model(self._model_name)
+    
+    @staticmethod
+    def _decode_audio(audio_file):
+        """Decode to a 16 kHz mono float32 array with libsndfile, or return the path
+        unchanged so Whisper falls back to decoding it through ffmpeg"""
+        try:
+            import numpy as np
+            import soundfile as sf
+        except ImportError:
+            return audio_file
+        try:
+            audio, sample_rate = sf.read(str(audio_file), dtype='float32', always_2d=True)
+        except Exception as e:
+            logger.debug("soundfile could not decode %s, using ffmpeg: %s", audio_file, e)
+            return audio_file
+        audio = audio.mean(axis=1) if audio.shape[1] > 1 else audio[:, 0]
+        if sample_rate != WHISPER_SAMPLE_RATE:
+            # Linear interpolation is plenty for speech recorded at a nearby rate
+            duration = len(audio) / sample_rate
+            target = np.arange(int(duration * WHISPER_SAMPLE_RATE)) / WHISPER_SAMPLE_RATE
+            audio = np.interp(target, np.arange(len(audio)) / sample_rate, audio).astype(np.float32)
+        return audio
+    
+    def _transcribe_sync(self, model, audio_file):
+        """Decode and transcribe with the loaded model (run in executor)"""
+        audio = self._decode_audio(audio_file)
+        if FASTER_WHISPER_AVAILABLE:
+            # Segments are generated lazily, so decoding happens while joining them
+            segments, _ = model.transcribe(audio, vad_filter=True)
+            return "".join(segment.text for segment in segments)
+        return model.transcribe(audio)["text"]
+    
+    async def prewarm(self):
+        """Load the Whisper model so it is ready when transcription starts"""
+        await self._ensure_model_loaded()
     
     async def transcribe_audio(self, audio_file):
         """Transcribe audio file using Whisper"""
         try:
-            logger.info(f"Transcribing audio file: {audio_file}")
+            logger.info("Transcribing audio file: %s", audio_file)
             model = await self._ensure_model_loaded()
             
             # Run transcription in executor to avoid blocking
             loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: model.transcribe(audio_file)
+                self._transcribe_sync,
+                model,
+                audio_file
             )
             
-            text = result["text"].strip()
-            logger.info(f"Transcription: {text}")
+            text = result.strip()
+            logger.info("Transcription: %s", text)
             return text
         except Exception as e:
             logger.error(f"Error transcribing audio: {str(e)}", exc_info=True)
@@ -108,7 +174,7 @@ class DummySTT(STTInterface):
     
     async def transcribe_audio(self, audio_file):
         """Return dummy text instead of actual transcription"""
-        logger.info(f"Dummy transcription for file: {audio_file}")
+        logger.info("Dummy transcription for file: %s", audio_file)
         return "This is dummy transcription text for testing purposes."
     
     async def transcribe_from_mic(self, duration=5):
@@ -1,14 +1,38 @@
 import os
+import signal
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from telegram import Update
 from telegram.ext import ApplicationBuilder, ContextTypes, CommandHandler, MessageHandler, filters
 from rin.core import Assistant
-from rin.config import TELEGRAM_BOT_TOKEN
+from rin.config import TELEGRAM_BOT_TOKEN, THREAD_POOL_SIZE
 from rin.logging_config import loggers
 
 logger = loggers.get('core', logging.getLogger('rin.telegram'))
 
+# Updates are handled concurrently, so one slow LLM reply doesn't hold up other
+# chats; each user gets at most this many messages in flight at once
+_PER_USER_CONCURRENCY = 4
+# Long-polling: getUpdates waits up to this many seconds for new messages
+_POLL_TIMEOUT = 30
+# Replies ready within this many seconds (local and cached answers) are sent
+# without first showing the typing indicator
+_TYPING_DELAY = 0.15
+# Plain-text messages (not /commands) go to the assistant
+_TEXT_FILTER = filters.TEXT & ~filters.COMMAND
+
+_START_TEXT = "👋 Hello! I'm Rin, your personal assistant. Ask me anything!"
+_HELP_TEXT = """*Rin Assistant Bot*
+
+You can ask me questions, and I'll do my best to help!
+
+*Commands:*
+/start - Start the conversation
+/help - Show this help message
+
+Just type your questions or requests normally, and I'll respond."""
+
 class RinTelegramBot:
     """Telegram bot integration for Rin"""
     
@@ -19,6 +43,8 @@ class RinTelegramBot:
             return
         
         self.assistant = Assistant()
+        self._user_slots = {}  # user id -> Semaphore, created on first message
+        self._stop = None  # Event set to end start(); created on the running loop
         logger.info("Telegram Bot initialized")
     
     async def start(self):
@@ -28,60 +54,74 @@ class RinTelegramBot:
             return False
         
         try:
+            # Concurrent chats each hold an executor thread for their blocking LLM
+            # calls; the default pool (at most 32 threads) is sized for one user
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="rin")
+            )
+            
             # Create the application
-            application = ApplicationBuilder().token(self.token).build()
+            application = ApplicationBuilder().token(self.token).concurrent_updates(True).build()
             
             # Add handlers
             application.add_handler(CommandHandler("start", self.start_command))
             application.add_handler(CommandHandler("help", self.help_command))
-            application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
+            application.add_handler(MessageHandler(_TEXT_FILTER, self.handle_message))
             
-            # Start the bot - the proper way to run polling
-            await application.initialize()
+            # Start the bot - the proper way to run polling; warm the assistant's
+            # engines while the Telegram connection comes up
+            await asyncio.gather(application.initialize(), self.assistant.warm())
             await application.start()
-            await application.updater.start_polling()
+            # Only messages are handled (commands are messages too)
+            await application.updater.start_polling(
+                poll_interval=0.0,
+                timeout=_POLL_TIMEOUT,
+                allowed_updates=[Update.MESSAGE]
+            )
             
             # Keep the bot running until a shutdown is requested
             logger.info("Telegram bot is running. Press Ctrl+C to stop.")
             
-            # Wait for a termination signal
-            stop_signal = asyncio.Future()
+            # Wait for SIGINT/SIGTERM (or stop()), then shut down in order
+            self._stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            signals = (signal.SIGINT, signal.SIGTERM)
+            try:
+                for sig in signals:
+                    loop.add_signal_handler(sig, self._stop.set)
+            except NotImplementedError:
+                signals = ()  # Windows: Ctrl+C raises KeyboardInterrupt instead
             
             try:
-                await stop_signal
+                await self._stop.wait()
             except asyncio.CancelledError:
                 pass
             finally:
+                for sig in signals:
+                    loop.remove_signal_handler(sig)
                 # Shutdown properly
                 await application.updater.stop()
                 await application.stop()
                 await application.shutdown()
+                await self.assistant.aclose()
                 
             return True
         except Exception as e:
             logger.error(f"Error starting Telegram bot: {str(e)}")
             return False
     
+    def stop(self):
+        """Ask a running start() to shut the bot down"""
+        if self._stop is not None:
+            self._stop.set()
+    
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
-        await update.message.reply_text(
-            "👋 Hello! I'm Rin, your personal assistant. Ask me anything!"
-        )
+        await update.message.reply_text(_START_TEXT)
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
-        help_text = """
-*Rin Assistant Bot*
-
-You can ask me questions, and I'll do my best to help!
-
-*Commands:*
-/start - Start the conversation
-/help - Show this help message
-
-Just type your questions or requests normally, and I'll respond.
-        """
-        await update.message.reply_text(help_text, parse_mode='Markdown')
+        await update.message.reply_text(_HELP_TEXT, parse_mode='Markdown')
     
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle incoming text messages"""
@@ -90,12 +130,22 @@ Just type your questions or requests normally, and I'll respond.
         
         logger.info(f"Telegram message from {user_id}: {user_message}")
         
-        # Show typing indicator
-        await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
-        
+        slots = self._user_slots.get(user_id)
+        if slots is None:
+            slots = self._user_slots[user_id] = asyncio.Semaphore(_PER_USER_CONCURRENCY)
+        async with slots:
+            await self._reply(update, context, user_message)
+    
+    async def _reply(self, update, context, user_message):
+        """Answer one message with Rin's reply"""
         try:
-            # Process the message with Rin
-            response = await self.assistant.process_query(user_message)
+            # Process the message with Rin, showing the typing indicator only
+            # if the reply isn't ready almost at once
+            task = asyncio.ensure_future(self.assistant.process_query(user_message))
+            done, _ = await asyncio.wait({task}, timeout=_TYPING_DELAY)
+            if not done:
+                await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
+            response = await task
             
             # Send the response
             await update.message.reply_text(response.get("text", "I'm not sure how to respond to that."))
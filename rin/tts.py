@@ -1,15 +1,33 @@
 import os
+import re
 import time
 import asyncio
+import hashlib
+import functools
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from pathlib import Path
 from google.cloud import texttospeech
-from rin.config import AUDIO_DIR, GOOGLE_CREDENTIALS
+from rin.config import AUDIO_DIR, GOOGLE_CREDENTIALS, TTS_CACHE_SIZE, TTS_AUDIO_ENCODING
 from rin.logging_config import loggers
 
 logger = loggers['tts']
 
+# Voice settings; they are part of the audio cache key
+LANGUAGE_CODE = "en-US"
+VOICE_GENDER = texttospeech.SsmlVoiceGender.NEUTRAL
+# Ogg Opus is about half the size of MP3 for speech, and Telegram plays it natively
+AUDIO_ENCODING = texttospeech.AudioEncoding[TTS_AUDIO_ENCODING.upper()]
+AUDIO_EXTENSION = {"MP3": "mp3", "OGG_OPUS": "ogg", "LINEAR16": "wav"}.get(AUDIO_ENCODING.name, "audio")
+VOICE = texttospeech.VoiceSelectionParams(language_code=LANGUAGE_CODE, ssml_gender=VOICE_GENDER)
+AUDIO_CONFIG = texttospeech.AudioConfig(audio_encoding=AUDIO_ENCODING)
+
+# Longer texts are synthesized one sentence per request, all concurrently, when
+# the encoding's output can simply be concatenated (MP3 frames; not Ogg or WAV headers)
+_SPLIT_SENTENCES = AUDIO_ENCODING.name == "MP3"
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
 class TTSInterface(ABC):
     """Abstract base class for TTS engines"""
     
@@ -28,52 +46,199 @@ class TTSInterface(ABC):
     async def synthesize(self, text):
         """Convert text to speech and return audio file path"""
         pass
+    
+    async def prewarm(self):
+        """Open connections ahead of first use (no-op unless an engine overrides it)"""
+        pass
+    
+    async def aclose(self):
+        """Close connections (no-op unless an engine holds any)"""
+        pass
+    
+    async def synthesize_stream(self, chunks):
+        """Synthesize text chunks in order, yielding (chunk, audio path) as each is ready
+        
+        chunks may be a list or an async iterable (e.g. sentences of a streamed
+        LLM reply); each chunk starts synthesizing as soon as it arrives.
+        """
+        # At most two started chunks run ahead of the one the caller is waiting on:
+        # one waiting in the queue, and one the feeder started before blocking in put
+        queue = asyncio.Queue(maxsize=1)
+        
+        async def feed():
+            try:
+                if hasattr(chunks, "__aiter__"):
+                    async for chunk in chunks:
+                        await put(chunk)
+                else:
+                    for chunk in chunks:
+                        await put(chunk)
+                await queue.put(None)
+            except Exception as e:
+                await queue.put(e)
+        
+        async def put(chunk):
+            task = asyncio.ensure_future(self.synthesize(chunk))
+            try:
+                await queue.put((chunk, task))
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+        
+        feeder = asyncio.ensure_future(feed())
+        task = None
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                chunk, task = item
+                yield chunk, await task
+        finally:
+            # Waiting for the cancelled feeder also closes the chunk source
+            # (e.g. an LLM stream) it was reading
+            feeder.cancel()
+            await asyncio.gather(feeder, return_exceptions=True)
+            if task is not None and not task.done():
+                task.cancel()
+            while not queue.empty():
+                item = queue.get_nowait()
+                if isinstance(item, tuple):
+                    item[1].cancel()
 
 class GoogleTTS(TTSInterface):
+    # Synthesized files are named by a hash of text and voice, so repeated phrases
+    # are served from AUDIO_DIR, across restarts too. The LRU of those hashes is
+    # shared by every instance and built from the directory on first use.
+    _audio_cache = None
+    # Syntheses in progress, by the same key, so concurrent requests for one
+    # phrase (from any instance) share a single API call
+    _inflight = {}
+    # One async client (and gRPC channel) for every instance, e.g. the assistant's
+    # and the reminder manager's. The channel binds to the loop it is created on,
+    # so it is created on first use, and again on another loop or in a forked child.
+    _client = None
+    _client_key = None  # (loop, pid) the client was created for
+    
     def __init__(self):
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = GOOGLE_CREDENTIALS
-        self.client = texttospeech.TextToSpeechClient()
+        if GoogleTTS._audio_cache is None:
+            GoogleTTS._audio_cache = self._scan_audio_cache()
         logger.info("Initialized Google TTS client")
     
+    @property
+    def client(self):
+        """The shared async client for the running loop"""
+        key = (asyncio.get_running_loop(), os.getpid())
+        if GoogleTTS._client is None or GoogleTTS._client_key != key:
+            GoogleTTS._client = texttospeech.TextToSpeechAsyncClient()
+            GoogleTTS._client_key = key
+        return GoogleTTS._client
+    
+    async def aclose(self):
+        """Close the shared gRPC channel; the next call opens a new one"""
+        if GoogleTTS._client is not None:
+            client, GoogleTTS._client = GoogleTTS._client, None
+            await client.transport.close()
+    
+    @staticmethod
+    def _scan_audio_cache():
+        """Index the cached audio files already in AUDIO_DIR, oldest first"""
+        files = sorted(
+            (path.stat().st_mtime, path.stem[len("rin_tts_"):])
+            for path in AUDIO_DIR.glob(f"rin_tts_*.{AUDIO_EXTENSION}")
+            if len(path.stem) == len("rin_tts_") + 64  # not an old timestamp-named file
+        )
+        return OrderedDict((key, None) for _, key in files)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=TTS_CACHE_SIZE)  # canned replies repeat verbatim
+    def _cache_key(text):
+        """Hash of everything that determines the synthesized audio"""
+        return hashlib.sha256(
+            f"{text}|{LANGUAGE_CODE}|{VOICE_GENDER.name}|{AUDIO_ENCODING.name}".encode("utf-8")
+        ).hexdigest()
+    
+    def _remember_audio(self, key):
+        """Mark key most recently used, deleting the least recent files over TTS_CACHE_SIZE"""
+        cache = self._audio_cache
+        cache[key] = None
+        cache.move_to_end(key)
+        while len(cache) > TTS_CACHE_SIZE:
+            old_key, _ = cache.popitem(last=False)
+            try:
+                (AUDIO_DIR / f"rin_tts_{old_key}.{AUDIO_EXTENSION}").unlink()
+            except FileNotFoundError:
+                pass
+    
     async def synthesize(self, text):
         """Asynchronously synthesize text to speech using Google Cloud"""
         try:
-            logger.info(f"Synthesizing text: {text[:50]}...")
-            
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self._synthesize_sync(text)
-            )
+            key = self._cache_key(text)
+            output_file = AUDIO_DIR / f"rin_tts_{key}.{AUDIO_EXTENSION}"
+            if output_file.exists():
+                self._remember_audio(key)
+                logger.info("Using cached audio for: %.50s...", text)
+                return str(output_file)
             
-            # Generate unique filename
-            timestamp = int(time.time())
-            output_file = AUDIO_DIR / f"rin_tts_{timestamp}.mp3"
-            
-            # Save audio content
-            with open(output_file, "wb") as out:
-                out.write(response.audio_content)
-                
-            logger.info(f"Audio saved to {output_file}")
-            return str(output_file)
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._synthesize_to_file(text, key, output_file))
+                self._inflight[key] = task
+                task.add_done_callback(lambda t: self._inflight.pop(key, None))
+            # Shield so one cancelled caller doesn't cancel the call for the others
+            return await asyncio.shield(task)
         except Exception as e:
             logger.error(f"Error synthesizing speech: {str(e)}", exc_info=True)
             raise
     
-    def _synthesize_sync(self, text):
-        """Synchronous Google TTS call (to be run in executor)"""
-        synthesis_input = texttospeech.SynthesisInput(text=text)
-        voice = texttospeech.VoiceSelectionParams(
-            language_code="en-US", 
-            ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL
-        )
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3
-        )
+    async def _synthesize_to_file(self, text, key, output_file):
+        """Synthesize text and save it as output_file, returning its path"""
+        logger.info("Synthesizing text: %.50s...", text)
         
-        return self.client.synthesize_speech(
-            input=synthesis_input, 
-            voice=voice, 
-            audio_config=audio_config
+        # Request latency grows with text length; the requests for each sentence
+        # run in parallel and their MP3 frames concatenate into one stream
+        sentences = [text]
+        if _SPLIT_SENTENCES:
+            sentences = [sentence for sentence in _SENTENCE_END_RE.split(text.strip()) if sentence]
+        if len(sentences) > 1:
+            chunks = await asyncio.gather(*(self._synthesize_audio(sentence) for sentence in sentences))
+            audio_content = b"".join(chunks)
+        else:
+            audio_content = await self._synthesize_audio(text)
+        
+        # Save audio content (off the loop: replies can run to hundreds of KB)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._save_audio, output_file, audio_content)
+        self._remember_audio(key)
+            
+        logger.info("Audio saved to %s", output_file)
+        return str(output_file)
+    
+    @staticmethod
+    def _save_audio(output_file, audio_content):
+        """Write audio under a temporary name and rename it, so a concurrent
+        lookup never finds a half-written file (run in executor)"""
+        partial_file = output_file.with_name(f"{output_file.name}.{time.time_ns()}.part")
+        with open(partial_file, "wb") as out:
+            out.write(audio_content)
+        os.replace(partial_file, output_file)
+    
+    async def _synthesize_audio(self, text):
+        """One synthesize_speech request; returns the encoded audio bytes"""
+        response = await self.client.synthesize_speech(
+            input=texttospeech.SynthesisInput(text=text),
+            voice=VOICE,
+            audio_config=AUDIO_CONFIG
         )
+        return response.audio_content
+    
+    async def prewarm(self):
+        """Establish the gRPC channel with a cheap list_voices call"""
+        try:
+            await self.client.list_voices(language_code=LANGUAGE_CODE)
+            logger.debug("Google TTS channel warmed up")
+        except Exception as e:
+            logger.warning(f"Google TTS prewarm failed: {str(e)}")
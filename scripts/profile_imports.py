@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Profile import time of the Rin CLI.
+
+Runs `python -X importtime -m rin <args>` and prints the slowest
+imports, so lazy-import regressions are easy to spot.
+
+Usage:
+    python scripts/profile_imports.py --help
+    python scripts/profile_imports.py list show-all
+"""
+
+import subprocess
+import sys
+
+TOP_N = 25
+
+def main():
+    args = sys.argv[1:] or ["--help"]
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "rin", *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    if not rows:
+        print("No import timings captured.")
+        return 1
+
+    total = max(r[0] for r in rows)
+    print(f"Slowest imports for: rin {' '.join(args)}")
+    print(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:TOP_N]:
+        print(f"{cumulative_us / 1000:>16.1f} {self_us / 1000:>10.1f}  {name}")
+    print(f"\nTotal import time: {total / 1000:.1f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
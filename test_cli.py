@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+import sys
+import types
+from unittest import mock
+
+def test_cli_builds_single_assistant():
+    """Importing the CLI must not build an Assistant; first use builds exactly one"""
+    calls = []
+
+    class FakeAssistant:
+        def __init__(self):
+            calls.append(self)
+
+    fake_core = types.ModuleType("rin.core")
+    fake_core.Assistant = FakeAssistant
+
+    with mock.patch.dict(sys.modules, {"rin.core": fake_core}):
+        import rin.cli
+        assert calls == []
+
+        rin.cli.get_assistant.cache_clear()
+        first = rin.cli.get_assistant()
+        second = rin.cli.get_assistant()
+
+    assert len(calls) == 1
+    assert first is second
+    rin.cli.get_assistant.cache_clear()
+
+if __name__ == "__main__":
+    test_cli_builds_single_assistant()
+    print("CLI Assistant test completed!")
@@ -14,6 +14,7 @@ async def test_query():
     response = await assistant.process_query(query)
     print(f"Response: {response['text']}")
     
+    await assistant.aclose()
     print("\nTest completed!")
 
 if __name__ == "__main__":
@@ -41,8 +41,13 @@ async def test_lists():
     items = await mgr.get_list('shopping')
     print(f"   Updated items: {items}")
     
+    # Get every list with its items in one call
+    print("\n6. Getting all lists with items...")
+    all_lists = await mgr.get_all_lists_with_items()
+    print(f"   All lists: {all_lists}")
+    
     # Delete list
-    print("\n6. Deleting shopping list...")
+    print("\n7. Deleting shopping list...")
     success = await mgr.delete_list('shopping')
     print(f"   Result: {'Success' if success else 'Failed'}")
     
@@ -50,6 +55,8 @@ async def test_lists():
     lists = await mgr.get_lists()
     print(f"   Remaining lists: {lists}")
     
+    # Close the manager's connection so its worker thread lets the process exit
+    await mgr.aclose()
     print("\nList test completed!")
 
 if __name__ == "__main__":
@@ -25,24 +25,27 @@ async def test_query_processing():
         "What are my active timers?"
     ]
     
-    # Process list queries
+    async def run_in_order(queries):
+        # Queries within a group build on each other (create, then add, then show)
+        return [await assistant.process_query(query) for query in queries]
+    
+    # The two groups are independent, so they run concurrently
+    list_responses, reminder_responses = await asyncio.gather(
+        run_in_order(list_queries),
+        run_in_order(reminder_queries)
+    )
+    
     print("TESTING LIST QUERIES:")
-    for query in list_queries:
+    for query, response in zip(list_queries, list_responses):
         print(f"\nQuery: {query}")
-        response = await assistant.process_query(query)
         print(f"Response: {response['text']}")
-        # Small delay to avoid flooding the output
-        await asyncio.sleep(0.5)
     
-    # Process reminder queries
     print("\n\nTESTING REMINDER QUERIES:")
-    for query in reminder_queries:
+    for query, response in zip(reminder_queries, reminder_responses):
         print(f"\nQuery: {query}")
-        response = await assistant.process_query(query)
         print(f"Response: {response['text']}")
-        # Small delay to avoid flooding the output
-        await asyncio.sleep(0.5)
     
+    await assistant.aclose()
     print("\nQuery processing test completed!")
 
 if __name__ == "__main__":
@@ -1,8 +1,35 @@
 #!/usr/bin/env python3
 import asyncio
-from rin.reminders import ReminderManager
+from rin.reminders import ReminderManager, parse_reminder_time
 import datetime
 
+# Reminder times parsed on Friday 2026-10-16 at 15:30, and where each should land
+PARSE_NOW = datetime.datetime(2026, 10, 16, 15, 30)
+PARSE_CASES = [
+    ("friday", datetime.datetime(2026, 10, 23, 9, 0)),  # today's 9am has passed
+    ("friday at 5pm", datetime.datetime(2026, 10, 16, 17, 0)),
+    ("january 3", datetime.datetime(2027, 1, 3, 9, 0)),
+    ("3pm", datetime.datetime(2026, 10, 17, 15, 0)),
+    ("5pm", datetime.datetime(2026, 10, 16, 17, 0)),
+    ("tomorrow at 2pm", datetime.datetime(2026, 10, 17, 14, 0)),
+    ("next friday", datetime.datetime(2026, 10, 23, 9, 0)),  # never tomorrow's saturday
+    ("next monday at 3pm", datetime.datetime(2026, 10, 19, 15, 0)),
+    ("noon", datetime.datetime(2026, 10, 17, 12, 0)),
+    ("tomorrow at noon", datetime.datetime(2026, 10, 17, 12, 0)),
+    ("midnight", datetime.datetime(2026, 10, 17, 0, 0)),
+]
+
+def test_reminder_time_parsing():
+    print("Testing reminder time parsing...")
+    failures = 0
+    for time_str, expected in PARSE_CASES:
+        due_time = parse_reminder_time(time_str, PARSE_NOW)
+        ok = due_time == expected
+        failures += not ok
+        print(f"   {'OK  ' if ok else 'FAIL'} '{time_str}' -> {due_time} (expected {expected})")
+    print(f"   {len(PARSE_CASES) - failures}/{len(PARSE_CASES)} parsed as expected\n")
+    assert failures == 0, f"{failures} reminder times parsed incorrectly"
+
 async def test_reminders():
     print("Testing ReminderManager...")
     
@@ -33,9 +60,11 @@ async def test_reminders():
     print("\n3. Listing all active reminders...")
     reminders = await mgr.get_reminders()
     if reminders:
-        for i, r in enumerate(reminders):
-            print(f"   {i+1}. {r['type'].capitalize()}: {r['description']} (ID: {r['id']})")
-            print(f"      Due at: {r['due_time']}")
+        print("\n".join(
+            f"   {i+1}. {r['type'].capitalize()}: {r['description']} (ID: {r['id']})\n"
+            f"      Due at: {r['due_time']}"
+            for i, r in enumerate(reminders)
+        ))
     else:
         print("   No active reminders found")
     
@@ -64,7 +93,10 @@ async def test_reminders():
     reminders = await mgr.get_reminders()
     print(f"\n7. Final reminder count: {len(reminders)}")
     
+    # Close the manager's connection so its worker thread lets the process exit
+    await mgr.aclose()
     print("\nReminder test completed!")
 
 if __name__ == "__main__":
+    test_reminder_time_parsing()
     asyncio.run(test_reminders()) 
\ No newline at end of file
@@ -6,9 +6,11 @@ This script checks if all components of Rin V0 are correctly configured
 and the API connections are working properly.
 """
 
+import io
 import os
 import sys
 import asyncio
+import contextvars
 from pathlib import Path
 
 # Make sure the package directory is in the Python path
@@ -96,7 +98,7 @@ async def test_stt():
     else:
         print("⚠️ Whisper is not installed. Speech recognition will use dummy mode.")
         print("   To enable actual speech recognition, install whisper:")
-        print("   pip install openai-whisper")
+        print("   pip install faster-whisper")
         return False
 
 async def test_storage():
@@ -133,6 +135,32 @@ async def test_audio():
         print(f"❌ Error with audio recording: {str(e)}")
         return False
 
+# The checks run concurrently; each one's prints go to its own buffer so the
+# report still reads one check at a time
+_check_output = contextvars.ContextVar("check_output", default=None)
+
+class _CheckOutput(io.TextIOBase):
+    """sys.stdout stand-in that routes writes to the current check's buffer"""
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        return (_check_output.get() or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+async def _run_check(check):
+    """Run one check (in its own task) with its output buffered; returns (result, output)"""
+    buffer = io.StringIO()
+    _check_output.set(buffer)
+    try:
+        result = await check()
+    except Exception as e:
+        print(f"❌ {check.__name__} failed: {str(e)}")
+        result = False
+    return result, buffer.getvalue()
+
 async def run_tests():
     """Run all tests"""
     print("\n🔍 STARTING RIN V0 SETUP VERIFICATION")
@@ -142,11 +170,16 @@ async def run_tests():
         print("\n❌ Environment setup incomplete. Please fix the issues above before continuing.")
         return
     
-    openai_test = await test_openai()
-    tts_test = await test_tts()
-    stt_check = await test_stt()
-    storage_test = await test_storage()
-    audio_test = await test_audio()
+    checks = (test_openai, test_tts, test_stt, test_storage, test_audio)
+    stdout = sys.stdout
+    sys.stdout = _CheckOutput(stdout)
+    try:
+        outcomes = await asyncio.gather(*(_run_check(check) for check in checks))
+    finally:
+        sys.stdout = stdout
+    for _, output in outcomes:
+        print(output, end="")
+    openai_test, tts_test, stt_check, storage_test, audio_test = (result for result, _ in outcomes)
     
     print("\n=== TEST SUMMARY ===")
     print(f"Environment Variables: {'✅' if env_check else '❌'}")
@@ -163,7 +196,7 @@ async def run_tests():
         if not WHISPER_AVAILABLE:
             print("\n⚠️ NOTE: Speech recognition is in dummy mode.")
             print("   To enable actual speech recognition, install whisper:")
-            print("   pip install openai-whisper")
+            print("   pip install faster-whisper")
             
         if not (AUDIO_RECORDING_AVAILABLE and AUDIO_PLAYBACK_AVAILABLE):
             print("\n⚠️ NOTE: Full audio capabilities are not available.")